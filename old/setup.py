@@ -81,6 +81,16 @@ setup(
             'flake8>=3.8',
             'mypy>=0.900',
         ],
+        'async': [
+            'aiohttp>=3.8.0',
+            'uvloop>=0.18; sys_platform != "win32"',
+        ],
+        'cache': [
+            'requests-cache>=1.0',
+        ],
+        'fast': [
+            'orjson>=3.6',
+        ],
         'test': [
             'pytest>=6.0',
             'pytest-cov>=2.0',
@@ -4,13 +4,16 @@ Enhanced Command Line Interface for Bangla News Scraper with Rich Styling
 
 import click
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Optional, Tuple
 
+from .scrapers.base import BaseScraper
 from .scrapers.prothom_alo import ProthomAloScraper
 from .scrapers.ittefaq import IttefaqScraper
 from .utils.output import save_to_json, save_to_csv, display_articles_summary, validate_articles
-from .utils.cache import ArticleCache
+from .utils.cache import ArticleCache, clear_http_cache, http_cache_stats
 from .utils import setup_logger, get_logger
 from .utils.cli_style import (
     print_startup_message, print_config_info, print_cache_stats,
@@ -26,40 +29,40 @@ from .exceptions import ScraperException
 logger = get_logger()
 
 
-def get_scraper_instance(site_name: str, delay: float):
+def get_scraper_instance(site_name: str, delay: float, session=None, cache=None):
     """Get scraper instance for a given site"""
     if site_name == 'prothom-alo':
-        return ProthomAloScraper(delay=delay)
+        return ProthomAloScraper(delay=delay, session=session, cache=cache)
     elif site_name == 'ittefaq':
-        return IttefaqScraper(delay=delay)
+        return IttefaqScraper(delay=delay, session=session, cache=cache)
     else:
         raise click.ClickException(f"Unsupported site: {site_name}")
 
 
-def scrape_single_site(site_name: str, limit: int, delay: float, output: str, output_dir: str):
-    """Scrape articles from a single site and return the result"""
-    print_site_header(site_name)
-    
+def save_result(result: ScrapingResult, output: str, output_dir: str, timestamp: str) -> str:
+    """Write a site's result in the chosen format and return the file path"""
+    if output == 'csv':
+        return save_to_csv(result, result.site_name, output_dir, timestamp)
+    return save_to_json(result, result.site_name, output_dir, timestamp)
+
+
+def collect_site_result(site_name: str, limit: int, delay: float, session=None, cache=None,
+                        scraper=None) -> Tuple[Optional[ScrapingResult], float, Optional[str]]:
+    """Scrape a site without printing; return the result (None on failure), duration and failure message"""
     start_time = time.time()
-    scraper = get_scraper_instance(site_name, delay)
+    scraper = scraper or get_scraper_instance(site_name, delay, session, cache)
     
     # Scrape articles
     articles = scraper.scrape_articles(limit=limit)
     
     if not articles:
-        duration = time.time() - start_time
-        print_site_result(site_name, 0, duration, success=False)
-        print_error(f"No articles found from {site_name}")
-        return None
+        return None, time.time() - start_time, f"No articles found from {site_name}"
     
     # Validate articles
     valid_articles = validate_articles(articles)
     
     if not valid_articles:
-        duration = time.time() - start_time
-        print_site_result(site_name, 0, duration, success=False)
-        print_error(f"No valid articles from {site_name} after validation")
-        return None
+        return None, time.time() - start_time, f"No valid articles from {site_name} after validation"
     
     # Create scraping result
     end_time = time.time()
@@ -74,8 +77,25 @@ def scrape_single_site(site_name: str, limit: int, delay: float, output: str, ou
         scraped_at=datetime.now().isoformat(),
         duration_seconds=duration
     )
-    
-    print_site_result(site_name, len(valid_articles), duration, success=True)
+    return result, duration, None
+
+
+def report_site_result(site_name: str, result: Optional[ScrapingResult], duration: float,
+                       failure: Optional[str]) -> None:
+    """Print the outcome of a site's scrape"""
+    if result is None:
+        print_site_result(site_name, 0, duration, success=False)
+        print_error(failure)
+    else:
+        print_site_result(site_name, len(result.articles), duration, success=True)
+
+
+def scrape_single_site(site_name: str, limit: int, delay: float, output: str, output_dir: str,
+                       session=None, cache=None, scraper=None):
+    """Scrape articles from a single site and return the result"""
+    print_site_header(site_name)
+    result, duration, failure = collect_site_result(site_name, limit, delay, session, cache, scraper)
+    report_site_result(site_name, result, duration, failure)
     return result
 
 
@@ -141,15 +161,17 @@ def main(run, site, limit, output, output_dir, delay, verbose, no_cache, clear_c
     # Initialize cache
     cache = ArticleCache()
     
-    # Handle cache operations
+    # Handle cache operations; these cover the HTTP response cache too
     if cache_stats:
         stats = cache.get_cache_stats()
-        print_cache_stats(stats)
+        print_cache_stats(stats, http_cache_stats())
         return
     
     if clear_cache:
         cleared = cache.clear()
         print_success(f"Cleared {cleared} cached articles", "🗑️")
+        cleared_http = clear_http_cache()
+        print_success(f"Cleared {cleared_http} cached HTTP responses", "🗑️")
         if not run:
             return
     
@@ -166,25 +188,54 @@ def main(run, site, limit, output, output_dir, delay, verbose, no_cache, clear_c
     print_config_info(site, limit, output, output_dir, delay)
     print_separator()
     
+    # One date for the whole run, so every site's file is named alike
+    timestamp = datetime.now().strftime('%Y-%m-%d')
+    # Results are written in the background as they arrive, overlapping
+    # with the sites still scraping and with the summary display
+    writer = ThreadPoolExecutor(max_workers=1)
+    saves = []
+    
     try:
         # Initialize scraper based on site
         start_time = time.time()
         all_results = []
+        session = BaseScraper.create_session()
         
         if site == 'all':
             # Scrape from all configured sites
             sites_to_scrape = Config.get_site_names()
             print_info(f"Scraping from {len(sites_to_scrape)} sites", "🔍")
             
-            for site_name in sites_to_scrape:
+            # Sites are independent and network-bound, so scrape them side by side;
+            # the workers don't print, each site's output is shown here in site order
+            scrapers = [get_scraper_instance(site_name, delay, session, cache)
+                        for site_name in sites_to_scrape]
+            with ThreadPoolExecutor(max_workers=len(sites_to_scrape)) as executor:
+                futures = [
+                    executor.submit(collect_site_result, site_name, limit, delay,
+                                    session, cache, scraper)
+                    for site_name, scraper in zip(sites_to_scrape, scrapers)
+                ]
                 try:
-                    result = scrape_single_site(site_name, limit, delay, output, output_dir)
-                    if result:
-                        all_results.append(result)
-                except Exception as e:
-                    print_error(f"Error scraping {site_name}: {e}")
-                    logger.error(f"Error scraping {site_name}: {e}")
-                    continue
+                    for site_name, future in zip(sites_to_scrape, futures):
+                        print_site_header(site_name)
+                        try:
+                            result, duration, failure = future.result()
+                            report_site_result(site_name, result, duration, failure)
+                            if result:
+                                all_results.append(result)
+                                saves.append(writer.submit(save_result, result, output,
+                                                           output_dir, timestamp))
+                        except Exception as e:
+                            print_error(f"Error scraping {site_name}: {e}")
+                            logger.error("Error scraping %s: %s", site_name, e)
+                            continue
+                except KeyboardInterrupt:
+                    # Ctrl-C lands here, not in the site threads; stop their waits
+                    # so leaving the pool doesn't block on rate limiter sleeps
+                    for scraper in scrapers:
+                        scraper.stop()
+                    raise
                     
             if not all_results:
                 print_error("No articles found from any site")
@@ -192,10 +243,11 @@ def main(run, site, limit, output, output_dir, delay, verbose, no_cache, clear_c
                 
         else:
             # Scrape from single site
-            result = scrape_single_site(site, limit, delay, output, output_dir)
+            result = scrape_single_site(site, limit, delay, output, output_dir, session, cache)
             if not result:
                 return
             all_results = [result]
+            saves.append(writer.submit(save_result, result, output, output_dir, timestamp))
         
         # Calculate total statistics
         total_duration = time.time() - start_time
@@ -221,22 +273,9 @@ def main(run, site, limit, output, output_dir, delay, verbose, no_cache, clear_c
         print_separator()
         print_info("Saving articles", "💾")
         
-        if site == 'all':
-            # Save each site separately
-            for result in all_results:
-                if output == 'json':
-                    filepath = save_to_json(result, result.site_name, output_dir)
-                elif output == 'csv':
-                    filepath = save_to_csv(result, result.site_name, output_dir)
-                print_file_saved(result.site_name, filepath)
-        else:
-            # Save single site
-            result = all_results[0]
-            if output == 'json':
-                filepath = save_to_json(result, site, output_dir)
-            elif output == 'csv':
-                filepath = save_to_csv(result, site, output_dir)
-            print_file_saved(site, filepath)
+        # Each site is saved to its own file; wait for the background writes
+        for result, save in zip(all_results, saves):
+            print_file_saved(result.site_name, save.result())
         
         print_separator()
         print_success(f"Successfully saved {total_articles} articles in {total_duration:.2f}s", "🎉")
@@ -245,12 +284,14 @@ def main(run, site, limit, output, output_dir, delay, verbose, no_cache, clear_c
         print_warning("Scraping interrupted by user", "⚠️")
     except ScraperException as e:
         print_error(f"Scraper error: {e}")
-        logger.error(f"Scraping failed: {e}")
+        logger.error("Scraping failed: %s", e)
         raise click.ClickException(str(e))
     except Exception as e:
         print_error(f"Unexpected error: {e}")
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         raise click.ClickException(str(e))
+    finally:
+        writer.shutdown()
 
 
 if __name__ == '__main__':
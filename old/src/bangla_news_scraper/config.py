@@ -13,10 +13,22 @@ class Config:
     DEFAULT_DELAY = 1.0
     DEFAULT_MAX_RETRIES = 3
     DEFAULT_TIMEOUT = 10
+    MAX_RESPONSE_BYTES = 4 << 20  # larger pages are refused instead of buffered
+    
+    # Concurrency settings
+    DEFAULT_CONCURRENCY = 10
+    DEFAULT_LIMIT_PER_HOST = 8
+    SECTION_FETCH_WORKERS = 2  # Prothom Alo section pages fetched ahead of the link consumer
+    DNS_CACHE_TTL = 300  # seconds the async connector keeps resolved hosts
+    
+    # Connection pool settings
+    POOL_CONNECTIONS = 32
+    POOL_MAXSIZE = 64
     
     # Request headers
     DEFAULT_HEADERS = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Connection': 'keep-alive'
     }
     
     # Site configurations
@@ -69,10 +81,13 @@ class Config:
     CACHE_ENABLED = True
     CACHE_DURATION_HOURS = 24
     CACHE_DIR = os.path.join(os.getcwd(), '.cache')
+    HTTP_CACHE_NAME = os.path.join(CACHE_DIR, 'http_cache')  # sqlite file used by requests-cache
+    HTTP_CACHE_EXPIRE_SECONDS = 3600
     
     # Output settings
     DEFAULT_OUTPUT_FORMAT = 'json'
     DEFAULT_OUTPUT_DIR = '.'
+    OUTPUT_BUFFER_SIZE = 1 << 20  # 1 MiB write buffer for JSON/CSV files
     
     @classmethod
     def get_site_config(cls, site_name: str) -> Dict:
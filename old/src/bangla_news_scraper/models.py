@@ -4,11 +4,24 @@ Data models for the Bangla News Scraper
 
 from typing import Optional, Dict, Any
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import re
+import sys
 
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Absolute http(s) URL with a domain, localhost or IPv4 host
+_URL_RE = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
+
+@dataclass(**_SLOTS)
 class Article:
     """Data model for a news article"""
     title: str
@@ -55,18 +68,21 @@ class Article:
     
     def _is_valid_url(self, url: str) -> bool:
         """Validate URL format"""
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-            r'localhost|'  # localhost...
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        return bool(url_pattern.match(url))
+        return bool(_URL_RE.match(url))
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert article to dictionary"""
-        return asdict(self)
+        # Every field is a plain string, so skip asdict()'s recursive deep copy
+        return {
+            'title': self.title,
+            'content': self.content,
+            'url': self.url,
+            'author': self.author,
+            'date': self.date,
+            'image_url': self.image_url,
+            'scraped_at': self.scraped_at,
+            'site_name': self.site_name
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Article':
@@ -94,7 +110,7 @@ class Article:
         return self.title[:max_length].rsplit(' ', 1)[0] + "..."
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ScrapingResult:
     """Result of a scraping operation"""
     articles: list[Article]
@@ -3,28 +3,203 @@ Abstract base scraper class
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Tuple
+from urllib.parse import urlparse
+from concurrent.futures import (
+    FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+)
+import asyncio
+import functools
+import itertools
 import requests
-import time
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 import re
+import soupsieve
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+try:
+    import requests_cache
+except ImportError:  # pragma: no cover - optional dependency
+    requests_cache = None
 
 from ..config import Config
 from ..models import Article
-from ..exceptions import NetworkException, ParseException
+from ..exceptions import NetworkException, ParseException, ConfigurationException
 from ..utils import get_logger
+from ..utils.cache import ArticleCache
+from ..utils.rate_limiter import HostRateLimiter, parse_retry_after
+
+# Only build tree nodes for anchors when collecting article links
+_LINK_STRAINER = SoupStrainer('a', href=True)
+
+# Responses that mean a host wants us to slow down
+_THROTTLE_STATUSES = (429, 503)
+
+# Chunk size for streaming response bodies
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+def _is_html(content_type: Optional[str]) -> bool:
+    """Check a Content-Type header for an (X)HTML page; a missing header gets the benefit of the doubt"""
+    return not content_type or 'html' in content_type.lower()
+
+
+def _declared_size(response: requests.Response) -> int:
+    """Body size announced by Content-Length, 0 when the server does not say"""
+    return int(response.headers.get('Content-Length') or 0)
+
+
+def _cacheable(response: requests.Response) -> bool:
+    """HTTP cache filter: store only HTML pages whose announced size is within the cap
+    
+    requests-cache calls this on the headers before it reads the body, so a rejected
+    response stays streamed and its body is never downloaded just to be cached.
+    """
+    return (_is_html(response.headers.get('Content-Type'))
+            and _declared_size(response) <= Config.MAX_RESPONSE_BYTES)
+
+
+def _substring_regex(patterns: List[str]) -> re.Pattern:
+    """Compile literal substrings into one alternation so a URL is scanned once"""
+    return re.compile('|'.join(map(re.escape, patterns)))
+
+
+# Excluded URL substrings (matched on the lowercased URL) and '$'-anchored suffixes
+_EXCLUDED_URL_RE = _substring_regex(
+    [p for p in Config.EXCLUDED_URL_PATTERNS if not p.endswith('$')])
+_EXCLUDED_URL_SUFFIXES = tuple(p[:-1] for p in Config.EXCLUDED_URL_PATTERNS if p.endswith('$'))
+
+# Hints that a URL points at an image, and image URLs to reject
+_IMAGE_ACCEPT_RE = _substring_regex([
+    '.jpg', '.jpeg', '.png', '.webp', '.gif', '.svg',
+    'img.', 'images.', 'photos.', 'cdn.', 'static.', 'assets.',
+    'media.', 'uploads.', 'files.'
+])
+_IMAGE_REJECT_RE = _substring_regex(Config.EXCLUDED_IMAGE_PATTERNS)
+
+
+# URL checks are pure functions of their arguments, and the same navigation and
+# image URLs repeat across pages, so their results are memoized
+@functools.lru_cache(maxsize=8192)
+def _valid_url(url: str) -> bool:
+    """Check that a URL is long enough and not on the exclusion lists"""
+    if not url or len(url) < 10:
+        return False
+    
+    # Check against excluded patterns
+    if url.endswith(_EXCLUDED_URL_SUFFIXES):
+        return False
+    
+    return not _EXCLUDED_URL_RE.search(url.lower())
+
+
+@functools.lru_cache(maxsize=8192)
+def _valid_image_url(url: str, base_host: str) -> bool:
+    """Check that a URL looks like an image (or is on the site's host) and is not excluded"""
+    if not url or len(url) < 10:
+        return False
+    
+    url_lower = url.lower()
+    
+    # Check for image patterns, or accept if from same domain
+    if _IMAGE_ACCEPT_RE.search(url_lower) is None and base_host not in url_lower:
+        return False
+    
+    # Filter out excluded patterns
+    return not _IMAGE_REJECT_RE.search(url_lower)
+
+
+class SelectorChain:
+    """Priority-ordered CSS selectors, matched with a single walk of the tree"""
+    
+    def __init__(self, selectors: List[str]):
+        self.selectors = selectors
+        self._union = soupsieve.compile(', '.join(selectors))
+        self._parts = [soupsieve.compile(selector) for selector in selectors]
+    
+    def select(self, soup: BeautifulSoup) -> Iterator[List[Tag]]:
+        """Yield what each selector matches, in priority order, skipping selectors with no match
+        
+        Gives the same lists as calling soup.select() per selector, but the document
+        is walked once for the union and each selector only re-checks those matches.
+        """
+        matches = self._union.select(soup)
+        for part in self._parts:
+            found = [element for element in matches if part.match(element)]
+            if found:
+                yield found
+    
+    def select_first(self, soup: BeautifulSoup) -> Iterator[Tag]:
+        """Yield each selector's first match in priority order, as select_one() per selector would"""
+        for found in self.select(soup):
+            yield found[0]
+
+
+@functools.lru_cache(maxsize=None)
+def _process_scraper(scraper_cls: type) -> 'BaseScraper':
+    """Scraper instance reused for parsing inside a worker process"""
+    # Parsing never fetches, so skip the pooled/cached session
+    return scraper_cls(session=requests.Session())
+
+
+def _parse_in_process(scraper_cls: type, content: bytes, url: str) -> Optional[Article]:
+    """Parse an article page in a worker process (only bytes and str are shipped over)"""
+    return _process_scraper(scraper_cls).parse_article(content, url)
 
 
 class BaseScraper(ABC):
     """Abstract base class for all news scrapers"""
     
-    def __init__(self, delay: float = None, max_retries: int = None, timeout: int = None):
+    def __init__(self, delay: float = None, max_retries: int = None, timeout: int = None,
+                 session: requests.Session = None, cache: ArticleCache = None):
         self.delay = delay or Config.DEFAULT_DELAY
         self.max_retries = max_retries or Config.DEFAULT_MAX_RETRIES
         self.timeout = timeout or Config.DEFAULT_TIMEOUT
-        self.session = requests.Session()
-        self.session.headers.update(Config.DEFAULT_HEADERS)
+        self.session = session or self.create_session()
         self.logger = get_logger(f"{self.__class__.__name__}")
+        self.rate_limiter = HostRateLimiter(self.delay)
+        # Parsed articles from earlier runs; a hit skips the fetch and parse entirely
+        self.cache = cache
+        # URL parts used by the per-link and per-image filters
+        self._base_url = self.base_url
+        self._base_scheme = self._base_url.split('://', 1)[0]
+        self._base_host = self._base_url.split('//', 1)[1].lower()
+        # Stamped on every article; the property looks it up in the site config
+        self._site_name = self.site_name
+    
+    @staticmethod
+    def create_session() -> requests.Session:
+        """Create a keep-alive session with an enlarged connection pool
+        
+        The session can be passed to several scrapers so they share pooled connections.
+        When caching is enabled and requests-cache is installed, responses are kept in
+        an on-disk HTTP cache so repeated runs do not refetch unchanged pages.
+        """
+        if Config.CACHE_ENABLED and requests_cache is not None:
+            session = requests_cache.CachedSession(
+                Config.HTTP_CACHE_NAME,
+                backend='sqlite',
+                expire_after=Config.HTTP_CACHE_EXPIRE_SECONDS,
+                stale_if_error=True,
+                cache_control=True,
+                filter_fn=_cacheable
+            )
+        else:
+            session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=Config.POOL_CONNECTIONS,
+            pool_maxsize=Config.POOL_MAXSIZE,
+            max_retries=0
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update(Config.DEFAULT_HEADERS)
+        return session
     
     @property
     @abstractmethod
@@ -40,34 +215,105 @@ class BaseScraper(ABC):
     
     def _make_request(self, url: str) -> Optional[requests.Response]:
         """Make HTTP request with retry logic"""
+        host = urlparse(url).netloc
         for attempt in range(self.max_retries):
             try:
-                time.sleep(self.delay)
-                response = self.session.get(url, timeout=self.timeout)
-                response.raise_for_status()
+                # Shared across worker threads, so the delay is per host rather than per thread;
+                # fresh cache hits never reach the server and skip it
+                response = self._cached_response(url)
+                if response is None:
+                    self.rate_limiter.acquire(host)
+                    if self.rate_limiter.stopped:
+                        return None
+                    response = self.session.get(url, timeout=self.timeout, stream=True)
+                # Streamed, so the connection is only released once the response is closed,
+                # including when it is rejected below
+                with response:
+                    response.raise_for_status()
+                    self.rate_limiter.relax(host)
+                    # Links can point at PDFs, images or feeds; don't download what we can't parse
+                    content_type = response.headers.get('Content-Type')
+                    if not _is_html(content_type):
+                        self.logger.warning("Skipping non-HTML response from %s (%s)", url, content_type)
+                        return None
+                    # Refuse an announced oversized body before any of it is read
+                    self._check_size(url, _declared_size(response), Config.MAX_RESPONSE_BYTES)
+                    # Fill .content ourselves so an oversized body is never fully read
+                    try:
+                        response._content = self._read_capped(response, url)
+                    except NetworkException:
+                        # Without Content-Length the HTTP cache has already stored the body;
+                        # drop it so later runs don't reread and reject it again
+                        self._evict_cached(url)
+                        raise
                 return response
             except requests.RequestException as e:
-                self.logger.warning(f"Request attempt {attempt + 1} failed for {url}: {e}")
+                self.logger.warning("Request attempt %s failed for %s: %s", attempt + 1, url, e)
                 if attempt == self.max_retries - 1:
-                    self.logger.error(f"Failed to fetch {url} after {self.max_retries} attempts")
+                    self.logger.error("Failed to fetch %s after %s attempts", url, self.max_retries)
                     raise NetworkException(f"Failed to fetch {url}: {e}", url=url)
-                time.sleep(self.delay * (attempt + 1))
+                if e.response is not None:
+                    self._back_off(host, attempt, e.response.headers, e.response.status_code)
+                else:
+                    self._back_off(host, attempt, {})
+        return None
+    
+    def stop(self) -> None:
+        """Stop waiting between requests and skip any fetch not yet started"""
+        self.rate_limiter.stop()
+    
+    def _cached_response(self, url: str) -> Optional[requests.Response]:
+        """Fresh response for the URL from the HTTP cache, looked up without the network"""
+        if requests_cache is None or not isinstance(self.session, requests_cache.CachedSession):
+            return None
+        # only_if_cached answers from the cache, or with a synthetic 504 on a miss, and may
+        # hand back a stale entry (stale_if_error); only a fresh hit is served
+        response = self.session.get(url, timeout=self.timeout, stream=True, only_if_cached=True)
+        if response.from_cache and response.status_code != 504 and not response.is_expired:
+            return response
+        response.close()
         return None
     
+    def _evict_cached(self, url: str) -> None:
+        """Remove the URL's response from the HTTP cache, if the session has one"""
+        if requests_cache is not None and isinstance(self.session, requests_cache.CachedSession):
+            self.session.cache.delete(urls=[url])
+    
+    def _read_capped(self, response: requests.Response, url: str) -> bytes:
+        """Read a streamed response body, refusing anything over MAX_RESPONSE_BYTES"""
+        cap = Config.MAX_RESPONSE_BYTES
+        body = bytearray()
+        for chunk in response.iter_content(_READ_CHUNK_SIZE):
+            body += chunk
+            self._check_size(url, len(body), cap)
+        return bytes(body)
+    
+    def _check_size(self, url: str, size: int, cap: int) -> None:
+        """Raise if a response body is larger than the cap"""
+        if size > cap:
+            raise NetworkException(f"Response from {url} exceeds {cap} bytes", url=url)
+    
+    def _back_off(self, host: str, attempt: int, headers, status: int = None) -> None:
+        """Delay the next request to a host, honouring Retry-After when the server sends it"""
+        if status in _THROTTLE_STATUSES:
+            # The host is overloaded: keep later requests spaced further apart too
+            self.rate_limiter.throttle(host)
+        retry_after = parse_retry_after(headers)
+        if retry_after is None:
+            retry_after = self.delay * 2 ** attempt
+        self.rate_limiter.defer(host, retry_after)
+    
+    def _parse(self, content: bytes) -> BeautifulSoup:
+        """Parse HTML content using the lxml backend"""
+        return BeautifulSoup(content, 'lxml')
+    
+    def _parse_links(self, content: bytes) -> BeautifulSoup:
+        """Parse only the <a href> tags of an HTML page"""
+        return BeautifulSoup(content, 'lxml', parse_only=_LINK_STRAINER)
+    
     def _is_valid_url(self, url: str) -> bool:
         """Check if URL is valid"""
-        if not url or len(url) < 10:
-            return False
-        
-        # Check against excluded patterns
-        for pattern in Config.EXCLUDED_URL_PATTERNS:
-            if pattern.endswith('$'):
-                if url.endswith(pattern[:-1]):
-                    return False
-            elif pattern in url.lower():
-                return False
-        
-        return True
+        return _valid_url(url)
     
     def _normalize_url(self, url: str) -> str:
         """Convert relative URLs to absolute URLs"""
@@ -76,75 +322,108 @@ class BaseScraper(ABC):
         
         url = url.strip()
         
-        if url.startswith('//'):
-            return 'https:' + url
-        elif url.startswith('/'):
-            return self.base_url + url
+        if url[:1] == '/':
+            if url[1:2] == '/':
+                return self._base_scheme + ':' + url
+            return self._base_url + url
         elif url.startswith('http'):
             return url
         else:
-            return self.base_url + '/' + url
+            return self._base_url + '/' + url
     
     def _is_valid_image_url(self, url: str) -> bool:
         """Check if URL is a valid image URL"""
-        if not url or len(url) < 10:
-            return False
-        
-        url_lower = url.lower()
-        
-        # Check for image patterns
-        image_patterns = [
-            '.jpg', '.jpeg', '.png', '.webp', '.gif', '.svg',
-            'img.', 'images.', 'photos.', 'cdn.', 'static.', 'assets.',
-            'media.', 'uploads.', 'files.'
-        ]
-        
-        has_image_pattern = any(pattern in url_lower for pattern in image_patterns)
-        
-        if not has_image_pattern:
-            # Accept if from same domain
-            if self.base_url.split('//')[1] in url_lower:
-                has_image_pattern = True
-        
-        if not has_image_pattern:
-            return False
-        
-        # Filter out excluded patterns
-        for pattern in Config.EXCLUDED_IMAGE_PATTERNS:
-            if pattern in url_lower:
-                return False
-        
-        return True
+        return _valid_image_url(url, self._base_host)
+    
+    def _collect_tags(self, soup: BeautifulSoup, names: Tuple[str, ...]) -> Dict[str, list]:
+        """Group the named tags, in document order, with a single tree pass"""
+        tags = {name: [] for name in names}
+        for tag in soup.find_all(names):
+            tags[tag.name].append(tag)
+        return tags
     
-    def _extract_meta_image(self, soup: BeautifulSoup) -> Optional[str]:
+    def _meta_index(self, soup: BeautifulSoup, metas: list = None) -> Dict[Tuple[str, str], Optional[str]]:
+        """Index <meta> content by ('property' | 'name', value) in a single tree pass"""
+        index = {}
+        for meta in soup.find_all('meta') if metas is None else metas:
+            content = meta.get('content')
+            for attr in ('property', 'name'):
+                key = meta.get(attr)
+                if key:
+                    # Keep the first tag in document order, like select_one would
+                    index.setdefault((attr, key), content)
+        return index
+    
+    def _extract_meta_image(self, soup: BeautifulSoup, meta: Dict = None) -> Optional[str]:
         """Extract image from meta tags"""
-        meta_selectors = [
-            'meta[property="og:image"]',
-            'meta[name="twitter:image"]',
-            'meta[property="twitter:image"]',
-            'meta[name="image"]',
-            'meta[property="image"]'
+        if meta is None:
+            meta = self._meta_index(soup)
+        
+        meta_keys = [
+            ('property', 'og:image'),
+            ('name', 'twitter:image'),
+            ('property', 'twitter:image'),
+            ('name', 'image'),
+            ('property', 'image')
         ]
         
-        for selector in meta_selectors:
-            element = soup.select_one(selector)
-            if element:
-                image_url = element.get('content')
-                if image_url and self._is_valid_image_url(image_url):
-                    return self._normalize_url(image_url)
+        for key in meta_keys:
+            image_url = meta.get(key)
+            if image_url and self._is_valid_image_url(image_url):
+                return self._normalize_url(image_url)
         
         return None
     
     @abstractmethod
-    def get_article_links(self, limit: int = 10) -> List[str]:
-        """Get article links from the site"""
+    def iter_article_links(self) -> Iterator[str]:
+        """Yield unique article links, fetching index pages only as they are consumed"""
         pass
     
+    def get_article_links(self, limit: int = 10) -> List[str]:
+        """Get up to limit article links from the site (0 = all available)"""
+        links = self.iter_article_links()
+        if limit > 0:
+            links = itertools.islice(links, limit)
+        
+        article_links = list(links)
+        self.logger.info("Found %s article links", len(article_links))
+        return article_links
+    
     @abstractmethod
-    def scrape_article(self, url: str) -> Optional[Article]:
-        """Scrape a single article"""
+    def parse_article(self, content: bytes, url: str) -> Optional[Article]:
+        """Build an article from the fetched page content"""
         pass
     
+    def scrape_article(self, url: str) -> Optional[Article]:
+        """Fetch and scrape a single article"""
+        cached = self._cached_article(url)
+        if cached:
+            return cached
+        
+        self.logger.info("Scraping article: %s", url)
+        
+        response = self._make_request(url)
+        if not response:
+            return None
+        
+        return self._store_article(url, self.parse_article(response.content, url))
+    
+    def _cached_article(self, url: str) -> Optional[Article]:
+        """Article cached by an earlier run, if the cache holds a valid one"""
+        if self.cache is None:
+            return None
+        article = self.cache.get(url)
+        if article and article.is_valid():
+            self.logger.debug("Using cached article: %s", url)
+            return article
+        return None
+    
+    def _store_article(self, url: str, article: Optional[Article]) -> Optional[Article]:
+        """Cache a freshly scraped article when it is valid, and pass it through"""
+        if self.cache is not None and article and article.is_valid():
+            self.cache.set(url, article)
+        return article
+    
     @abstractmethod
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """Extract article title"""
@@ -170,36 +449,192 @@ class BaseScraper(ABC):
         """Extract main article image"""
         pass
     
-    def scrape_articles(self, limit: int = 10) -> List[Article]:
-        """Scrape multiple articles"""
+    def scrape_articles(self, limit: int = 10, concurrency: int = None) -> List[Article]:
+        """Scrape multiple articles using a pool of worker threads"""
+        concurrency = concurrency or Config.DEFAULT_CONCURRENCY
         if limit == 0:
-            self.logger.info(f"Starting to scrape ALL available articles from {self.site_name}")
+            self.logger.info("Starting to scrape ALL available articles from %s", self.site_name)
         else:
-            self.logger.info(f"Starting to scrape {limit} articles from {self.site_name}")
+            self.logger.info("Starting to scrape %s articles from %s", limit, self.site_name)
         
-        # Get article links
-        multiplier = 3 if limit > 0 else 1
-        article_links = self.get_article_links(limit * multiplier if limit > 0 else 0)
-        articles = []
-        
-        total_links = len(article_links)
-        for i, link in enumerate(article_links):
-            if limit > 0 and len(articles) >= limit:
-                break
-                
-            self.logger.info(f"Processing article {i + 1}/{total_links}")
-            try:
-                article = self.scrape_article(link)
-                if article and article.is_valid():
-                    articles.append(article)
-                    self.logger.debug(f"Successfully scraped: {article.get_title_preview()}")
-                else:
-                    self.logger.warning(f"Invalid article data for {link}")
-            except Exception as e:
-                self.logger.error(f"Error scraping article {link}: {e}")
+        # Links are pulled lazily, a few candidates per wanted article, and only as
+        # many fetches run as could still be needed, so none are wasted at the end
+        link_iter = self.iter_article_links()
+        candidates = enumerate(itertools.islice(link_iter, limit * 3) if limit > 0 else link_iter)
+        results = {}
+        in_flight = {}
+        
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            def refill():
+                wanted = concurrency if limit == 0 else min(concurrency, limit - len(results))
+                while len(in_flight) < wanted:
+                    candidate = next(candidates, None)
+                    if candidate is None:
+                        return
+                    in_flight[executor.submit(self.scrape_article, candidate[1])] = candidate
             
-            # Respect rate limiting
-            time.sleep(self.delay)
+            processed = 0
+            try:
+                refill()
+                while in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        i, link = in_flight.pop(future)
+                        processed += 1
+                        self.logger.info("Processed article %s", processed)
+                        try:
+                            article = future.result()
+                            if article and article.is_valid():
+                                results[i] = article
+                                self.logger.debug("Successfully scraped: %s", article.get_title_preview())
+                            else:
+                                self.logger.warning("Invalid article data for %s", link)
+                        except Exception as e:
+                            self.logger.error("Error scraping article %s: %s", link, e)
+                    
+                    if limit > 0 and len(results) >= limit:
+                        break
+                    refill()
+            except KeyboardInterrupt:
+                # Wake workers sleeping in the rate limiter so shutdown doesn't wait them out
+                self.stop()
+                for pending in in_flight:
+                    pending.cancel()
+                raise
+            finally:
+                # Stop link discovery (and any section fetches it has running)
+                if hasattr(link_iter, 'close'):
+                    link_iter.close()
+        
+        # Keep the original link order
+        articles = [results[i] for i in sorted(results)]
+        if limit > 0:
+            articles = articles[:limit]
+        
+        self.logger.info("Successfully scraped %s articles from %s", len(articles), self.site_name)
+        return articles
+    
+    async def _fetch_async(self, session, url: str) -> Optional[bytes]:
+        """Fetch a URL with aiohttp, retrying with exponential backoff"""
+        host = urlparse(url).netloc
+        for attempt in range(self.max_retries):
+            await self.rate_limiter.acquire_async(host)
+            if self.rate_limiter.stopped:
+                return None
+            try:
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    self.rate_limiter.relax(host)
+                    content_type = response.headers.get('Content-Type')
+                    if not _is_html(content_type):
+                        self.logger.warning("Skipping non-HTML response from %s (%s)", url, content_type)
+                        return None
+                    cap = Config.MAX_RESPONSE_BYTES
+                    self._check_size(url, response.content_length or 0, cap)
+                    body = bytearray()
+                    async for chunk in response.content.iter_chunked(_READ_CHUNK_SIZE):
+                        body += chunk
+                        self._check_size(url, len(body), cap)
+                    return bytes(body)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.logger.warning("Request attempt %s failed for %s: %s", attempt + 1, url, e)
+                if attempt == self.max_retries - 1:
+                    self.logger.error("Failed to fetch %s after %s attempts", url, self.max_retries)
+                    raise NetworkException(f"Failed to fetch {url}: {e}", url=url)
+                self._back_off(host, attempt, getattr(e, 'headers', None) or {}, getattr(e, 'status', None))
+    
+    async def _scrape_article_async(self, session, semaphore: asyncio.Semaphore, url: str,
+                                    executor: Executor = None) -> Optional[Article]:
+        """Fetch a single article, bounded by the semaphore, and parse it off the event loop"""
+        try:
+            cached = self._cached_article(url)
+            if cached:
+                return cached
+            async with semaphore:
+                content = await self._fetch_async(session, url)
+            if content is None:
+                return None
+            # Parsing is CPU-bound; keep it from stalling the other fetches
+            if executor is None:
+                article = await asyncio.to_thread(self.parse_article, content, url)
+            else:
+                loop = asyncio.get_running_loop()
+                article = await loop.run_in_executor(executor, _parse_in_process, type(self), content, url)
+            return self._store_article(url, article)
+        except Exception as e:
+            self.logger.error("Error scraping article %s: %s", url, e)
+            return None
+    
+    async def scrape_articles_async(self, limit: int = 10, concurrency: int = None,
+                                    processes: int = None) -> List[Article]:
+        """Scrape multiple articles concurrently using aiohttp
+        
+        With processes set, pages are parsed in that many worker processes
+        instead of threads, so parsing is not serialized by the GIL.
+        """
+        if aiohttp is None:
+            raise ConfigurationException(
+                "aiohttp is required for async scraping (pip install bangla-news-scraper[async])"
+            )
+        
+        concurrency = concurrency or Config.DEFAULT_CONCURRENCY
+        if limit == 0:
+            self.logger.info("Starting to scrape ALL available articles from %s", self.site_name)
+        else:
+            self.logger.info("Starting to scrape %s articles from %s", limit, self.site_name)
+        
+        # Link discovery stays synchronous; run it off the event loop
+        multiplier = 3 if limit > 0 else 1
+        article_links = await asyncio.to_thread(
+            self.get_article_links, limit * multiplier if limit > 0 else 0
+        )
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        connector = aiohttp.TCPConnector(
+            limit_per_host=Config.DEFAULT_LIMIT_PER_HOST,
+            ttl_dns_cache=Config.DNS_CACHE_TTL
+        )
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        
+        executor = ProcessPoolExecutor(processes) if processes else None
+        
+        try:
+            async with aiohttp.ClientSession(
+                connector=connector, timeout=timeout, headers=Config.DEFAULT_HEADERS
+            ) as session:
+                tasks = [
+                    asyncio.create_task(self._scrape_article_async(session, semaphore, link, executor))
+                    for link in article_links
+                ]
+                pending = set(tasks)
+                # tasks[:settled] have finished, holding valid_count valid articles
+                settled = 0
+                valid_count = 0
+                try:
+                    # Stop as soon as the finished prefix of links holds enough valid articles,
+                    # so the kept articles are the first valid ones in link order, as with
+                    # scrape_articles, rather than the first ones to arrive
+                    while pending and not (limit > 0 and valid_count >= limit):
+                        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        while settled < len(tasks) and tasks[settled].done():
+                            article = tasks[settled].result()
+                            valid_count += bool(article and article.is_valid())
+                            settled += 1
+                finally:
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+        
+        # Keep the original link order
+        articles = [
+            task.result() for task in tasks
+            if not task.cancelled() and task.result() and task.result().is_valid()
+        ]
+        if limit > 0:
+            articles = articles[:limit]
         
-        self.logger.info(f"Successfully scraped {len(articles)} articles from {self.site_name}")
+        self.logger.info("Successfully scraped %s articles from %s", len(articles), self.site_name)
         return articles
\ No newline at end of file
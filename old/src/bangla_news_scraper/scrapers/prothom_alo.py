@@ -2,15 +2,139 @@
 Prothom Alo news scraper implementation
 """
 
-from typing import List, Optional
-from bs4 import BeautifulSoup
+from typing import Dict, Iterator, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from bs4 import BeautifulSoup, NavigableString
 from datetime import datetime
+import functools
+import itertools
+import json
+import logging
 import re
 
-from .base import BaseScraper
+from .base import BaseScraper, SelectorChain
 from ..models import Article
 from ..config import Config
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# JSON-LD decoder, orjson when it is installed
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Alt text that marks an image as site chrome rather than article media
+_CHROME_ALT_RE = re.compile('logo|icon|share|social')
+
+# Filename hints for the main article image
+_MAIN_IMAGE_SRC_RE = re.compile('main|feature|hero|lead|primary')
+
+# Attributes holding an image's URL, eager first, then common lazy-load variants
+_SRC_ATTRS = ('src', 'data-src', 'data-lazy-src', 'data-original')
+
+# Section index pages that look like article URLs
+_SECTION_SUFFIXES = tuple(
+    'prothomalo.com/' + section for section in (
+        'bangladesh', 'world', 'sports', 'entertainment', 'business',
+        'politics', 'opinion', 'lifestyle', 'tech', ''
+    )
+)
+
+# Article URL shapes: a numeric path segment (ids and dated paths) or a long slug
+_ARTICLE_PATH_RE = re.compile(r'/\d+/|/[a-zA-Z0-9\-]{20,}/?$')
+
+
+def _json_ld_nodes(data) -> Iterator[dict]:
+    """Yield a JSON-LD document's top-level object, then any Article nodes in a list or '@graph'"""
+    if isinstance(data, dict):
+        yield data
+        data = data.get('@graph')
+    if not isinstance(data, list):
+        return
+    
+    for node in data:
+        if not isinstance(node, dict):
+            continue
+        types = node.get('@type')
+        if isinstance(types, str):
+            types = [types]
+        # NewsArticle, ReportageNewsArticle, ... rather than WebPage or Organization nodes
+        if isinstance(types, list) and any(isinstance(t, str) and 'Article' in t for t in types):
+            yield node
+
+
+@functools.lru_cache(maxsize=8192)
+def _is_article_path(url: str) -> bool:
+    """Check the shape of an already validated Prothom Alo URL for an article"""
+    # Prothom Alo specific excluded patterns
+    if url.endswith(_SECTION_SUFFIXES):
+        return False
+    
+    # Articles usually have deeper paths (same as split('/') giving 5+ parts)
+    if url.count('/') >= 4:
+        return True
+    
+    # Otherwise look for an article id, date or slug in one scan
+    return _ARTICLE_PATH_RE.search(url) is not None
+
+
+# Extractor candidates, best first
+_TITLE_SELECTORS = SelectorChain([
+    'h1.headline',
+    'h1[itemprop="headline"]',
+    'h1.entry-title',
+    'h1',
+    '.headline h1',
+    '.story-element-text h1'
+])
+_CONTENT_SELECTORS = SelectorChain([
+    '.story-element-text',
+    '.story-content',
+    '.entry-content',
+    '[itemprop="articleBody"]',
+    '.article-body',
+    '.content-body'
+])
+_AUTHOR_SELECTORS = SelectorChain([
+    '[itemprop="author"]',
+    '.author-name',
+    '.byline',
+    '.reporter-name',
+    '.writer-name'
+])
+_DATE_SELECTORS = SelectorChain([
+    '[itemprop="datePublished"]',
+    '.publish-date',
+    '.date',
+    '.timestamp',
+    'time'
+])
+_IMAGE_SELECTORS = SelectorChain([
+    'img[width][height]',
+    '.story-element img',
+    '.article-image img',
+    '.content-image img',
+    '.featured-image img',
+    '.hero-image img',
+    'figure img',
+    'picture img',
+    '.story-content img',
+    'article img',
+    'main img'
+])
+
+# Containers the byline is searched in before falling back to the whole page
+_BYLINE_SCOPE_SELECTOR = 'article, .story-content, .article-body'
+
+# Bylines in the page text
+_BYLINE_RES = [
+    re.compile(r'প্রতিবেদক[:\s]*([^\n,]+)'),
+    re.compile(r'সংবাদদাতা[:\s]*([^\n,]+)'),
+    re.compile(r'স্টাফ রিপোর্টার[:\s]*([^\n,]+)')
+]
+
 
 class ProthomAloScraper(BaseScraper):
     """Scraper implementation for Prothom Alo news website"""
@@ -23,163 +147,118 @@ class ProthomAloScraper(BaseScraper):
     def site_name(self) -> str:
         return Config.get_site_config('prothom-alo')['name']
     
-    def get_article_links(self, limit: int = 10) -> List[str]:
-        """Get article links from the homepage and sections"""
-        if limit == 0:
-            self.logger.info("Fetching ALL available article links from Prothom Alo...")
-        else:
-            self.logger.info("Fetching article links from Prothom Alo homepage...")
+    def iter_article_links(self) -> Iterator[str]:
+        """Yield article links from the homepage, then from sections as more are needed"""
+        self.logger.info("Fetching article links from Prothom Alo homepage...")
         
-        response = self._make_request(self.base_url)
+        response = self._make_request(self._base_url)
         if not response:
-            return []
+            return
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        links = []
+        soup = self._parse_links(response.content)
+        seen = set()
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
         
-        # Find all anchor tags and filter for actual article links
-        all_links = soup.find_all('a', href=True)
-        self.logger.info(f"Found {len(all_links)} total links on homepage")
+        # Find all anchor tags and filter for actual article links; the link
+        # strainer only builds <a href> tags, so neither needs checking again
+        all_links = soup.find_all('a')
+        self.logger.info("Found %s total links on homepage", len(all_links))
         
         for link in all_links:
-            href = link.get('href')
+            href = link['href']
             if href:
                 # Convert relative URLs to absolute
                 full_url = self._normalize_url(href)
                 
                 # Filter for actual article URLs
-                if self._is_article_link(full_url) and full_url not in links:
-                    links.append(full_url)
-                    self.logger.debug(f"Added article link: {full_url}")
-                    
-                # Only break if limit > 0
-                if limit > 0 and len(links) >= limit:
-                    break
+                if self._is_article_link(full_url) and full_url not in seen:
+                    seen.add(full_url)
+                    if debug_enabled:
+                        self.logger.debug("Added article link: %s", full_url)
+                    yield full_url
+        
+        # Sections are only fetched if the consumer keeps asking for links; from
+        # then on a few are fetched ahead of it, still spaced by the per-host limiter
+        sections = Config.get_site_config('prothom-alo')['sections']
+        section_urls = iter([self._base_url + section for section in sections])
+        pool = ThreadPoolExecutor(max_workers=Config.SECTION_FETCH_WORKERS)
+        pending = deque(
+            (section_url, pool.submit(self._make_request, section_url))
+            for section_url in itertools.islice(section_urls, Config.SECTION_FETCH_WORKERS)
+        )
         
-        # If we need more links, try browsing specific sections
-        if limit == 0 or len(links) < limit:
-            sections = Config.get_site_config('prothom-alo')['sections']
-            
-            for section in sections:
-                if limit > 0 and len(links) >= limit:
-                    break
-                    
-                section_url = self.base_url + section
-                self.logger.info(f"Checking section: {section_url}")
+        try:
+            while pending:
+                section_url, future = pending.popleft()
+                section_response = future.result()
+                # Keep the lookahead window full while this section's links are consumed
+                next_url = next(section_urls, None)
+                if next_url is not None:
+                    pending.append((next_url, pool.submit(self._make_request, next_url)))
                 
-                section_response = self._make_request(section_url)
-                if section_response:
-                    section_soup = BeautifulSoup(section_response.content, 'html.parser')
-                    section_links = section_soup.find_all('a', href=True)
-                    
-                    for link in section_links:
-                        href = link.get('href')
-                        if href:
-                            full_url = self._normalize_url(href)
-                            
-                            if self._is_article_link(full_url) and full_url not in links:
-                                links.append(full_url)
-                                self.logger.debug(f"Added section article link: {full_url}")
-                                
-                            if limit > 0 and len(links) >= limit:
-                                break
-        
-        if limit == 0:
-            self.logger.info(f"Found {len(links)} total article links (ALL available)")
-        else:
-            self.logger.info(f"Found {len(links)} article links")
-            return links[:limit]
-        
-        return links
+                self.logger.info("Checking section: %s", section_url)
+                if not section_response:
+                    continue
+                
+                section_soup = self._parse_links(section_response.content)
+                section_links = section_soup.find_all('a')
+                
+                for link in section_links:
+                    href = link['href']
+                    if href:
+                        full_url = self._normalize_url(href)
+                        
+                        if self._is_article_link(full_url) and full_url not in seen:
+                            seen.add(full_url)
+                            if debug_enabled:
+                                self.logger.debug("Added section article link: %s", full_url)
+                            yield full_url
+        finally:
+            # Nothing outlives the generator: at most the lookahead window is still
+            # running when the consumer stops, and it is waited for
+            pool.shutdown(wait=True, cancel_futures=True)
     
     def _is_article_link(self, url: str) -> bool:
         """Check if URL is an actual article link"""
-        if not self._is_valid_url(url):
-            return False
-        
-        # Prothom Alo specific excluded patterns
-        excluded_patterns = [
-            'prothomalo.com/bangladesh$',
-            'prothomalo.com/world$',
-            'prothomalo.com/sports$',
-            'prothomalo.com/entertainment$',
-            'prothomalo.com/business$',
-            'prothomalo.com/politics$',
-            'prothomalo.com/opinion$',
-            'prothomalo.com/lifestyle$',
-            'prothomalo.com/tech$',
-            'prothomalo.com/$',
-        ]
-        
-        for pattern in excluded_patterns:
-            if url.endswith(pattern[:-1]):  # Remove $ from pattern
-                return False
-        
-        # Look for actual article patterns
-        if len(url.split('/')) >= 5:  # Articles usually have deeper paths
-            return True
-        
-        # Check for date patterns in URL
-        if re.search(r'/\d{4}/\d{2}/\d{2}/', url):
-            return True
-        
-        # Check for article ID patterns
-        if re.search(r'/\d+/', url):
-            return True
-        
-        # Check if URL has article-like text
-        if re.search(r'/[a-zA-Z0-9\-]{20,}/?$', url):
-            return True
-        
-        return False
+        # Both checks are memoized; navigation links repeat across every section page
+        return self._is_valid_url(url) and _is_article_path(url)
     
-    def scrape_article(self, url: str) -> Optional[Article]:
-        """Scrape a single article"""
-        self.logger.info(f"Scraping article: {url}")
-        
-        response = self._make_request(url)
-        if not response:
-            return None
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
+    def parse_article(self, content: bytes, url: str) -> Optional[Article]:
+        """Build an article from the fetched page content"""
+        # Full tree: the text fallbacks need bylines and dates wherever they sit
+        soup = self._parse(content)
+        # Walk the tree once for every tag the extractors scan in full
+        tags = self._collect_tags(soup, ('meta', 'p', 'script'))
+        meta = self._meta_index(soup, tags['meta'])
+        # JSON-LD blocks for the image fallback, picked from the tags already collected
+        json_scripts = [s for s in tags['script'] if s.get('type') == 'application/ld+json']
         
         try:
             article = Article(
                 url=url,
                 title=self._extract_title(soup),
-                content=self._extract_content(soup),
+                content=self._extract_content(soup, tags['p']),
                 author=self._extract_author(soup),
-                date=self._extract_date(soup),
-                image_url=self._extract_main_image(soup, url),
-                site_name=self.site_name
+                date=self._extract_date(soup, meta),
+                image_url=self._extract_main_image(soup, url, meta, json_scripts),
+                site_name=self._site_name
             )
             
             if article.is_valid():
-                self.logger.info(f"Successfully scraped: {article.get_title_preview()}")
+                self.logger.info("Successfully scraped: %s", article.get_title_preview())
                 return article
             else:
-                self.logger.warning(f"Incomplete article data for {url}")
+                self.logger.warning("Incomplete article data for %s", url)
                 return None
             
         except Exception as e:
-            self.logger.error(f"Error extracting article data from {url}: {e}")
+            self.logger.error("Error extracting article data from %s: %s", url, e)
             return None
     
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """Extract article title"""
-        selectors = [
-            'h1.headline',
-            'h1[itemprop="headline"]',
-            'h1.entry-title',
-            'h1',
-            '.headline h1',
-            '.story-element-text h1'
-        ]
-        
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                return element.get_text(strip=True)
+        for element in _TITLE_SELECTORS.select_first(soup):
+            return element.get_text(strip=True)
         
         # Fallback to page title
         title_tag = soup.find('title')
@@ -188,39 +267,30 @@ class ProthomAloScraper(BaseScraper):
         
         return "No title found"
     
-    def _extract_content(self, soup: BeautifulSoup) -> str:
+    def _extract_content(self, soup: BeautifulSoup, paragraphs: list = None) -> str:
         """Extract article content"""
-        selectors = [
-            '.story-element-text',
-            '.story-content',
-            '.entry-content',
-            '[itemprop="articleBody"]',
-            '.article-body',
-            '.content-body'
-        ]
-        
-        for selector in selectors:
-            elements = soup.select(selector)
-            if elements:
-                content_parts = []
-                for element in elements:
-                    # Remove script and style elements
-                    for script in element(["script", "style"]):
-                        script.decompose()
-                    
-                    text = element.get_text(strip=True)
-                    if text and len(text) > 50:
-                        content_parts.append(text)
-                
-                if content_parts:
-                    return '\n\n'.join(content_parts)
+        for elements in _CONTENT_SELECTORS.select(soup):
+            content_parts = []
+            for element in elements:
+                # get_text() already leaves out <script> and <style> strings, so
+                # there is no need to walk the element and decompose them first
+                text = element.get_text(strip=True)
+                if text and len(text) > 50:
+                    content_parts.append(text)
+            
+            if content_parts:
+                return '\n\n'.join(content_parts)
         
         # Fallback: try to find paragraphs
-        paragraphs = soup.find_all('p')
+        if paragraphs is None:
+            paragraphs = soup.find_all('p')
         if paragraphs:
             content_parts = []
             for p in paragraphs:
-                text = p.get_text(strip=True)
+                # Most paragraphs hold a single plain string; read it directly
+                # instead of walking descendants (get_text skips comments)
+                string = p.string
+                text = string.strip() if type(string) is NavigableString else p.get_text(strip=True)
                 if text and len(text) > 20:
                     content_parts.append(text)
             
@@ -231,90 +301,70 @@ class ProthomAloScraper(BaseScraper):
     
     def _extract_author(self, soup: BeautifulSoup) -> str:
         """Extract article author"""
-        selectors = [
-            '[itemprop="author"]',
-            '.author-name',
-            '.byline',
-            '.reporter-name',
-            '.writer-name'
-        ]
-        
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                return element.get_text(strip=True)
-        
-        # Look for common author patterns in text
-        byline_patterns = [
-            r'প্রতিবেদক[:\s]*([^\n,]+)',
-            r'সংবাদদাতা[:\s]*([^\n,]+)',
-            r'স্টাফ রিপোর্টার[:\s]*([^\n,]+)'
-        ]
-        
-        page_text = soup.get_text()
-        for pattern in byline_patterns:
-            match = re.search(pattern, page_text)
-            if match:
-                return match.group(1).strip()
+        for element in _AUTHOR_SELECTORS.select_first(soup):
+            return element.get_text(strip=True)
+        
+        # Look for common author patterns in the article body first, so the
+        # whole page's text is only built when the body has no byline
+        scope = soup.select_one(_BYLINE_SCOPE_SELECTOR)
+        for container in (scope, soup) if scope is not None else (soup,):
+            text = container.get_text()
+            for pattern in _BYLINE_RES:
+                match = pattern.search(text)
+                if match:
+                    return match.group(1).strip()
         
         return "Unknown"
     
-    def _extract_date(self, soup: BeautifulSoup) -> str:
+    def _extract_date(self, soup: BeautifulSoup, meta: Dict = None) -> str:
         """Extract article date"""
-        selectors = [
-            '[itemprop="datePublished"]',
-            '.publish-date',
-            '.date',
-            '.timestamp',
-            'time'
-        ]
-        
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                # Try to get datetime attribute first
-                date_attr = element.get('datetime') or element.get('content')
-                if date_attr:
-                    return date_attr
-                
-                # Otherwise get text content
-                date_text = element.get_text(strip=True)
-                if date_text:
-                    return date_text
+        for element in _DATE_SELECTORS.select_first(soup):
+            # Try to get datetime attribute first
+            date_attr = element.get('datetime') or element.get('content')
+            if date_attr:
+                return date_attr
+            
+            # Otherwise get text content
+            date_text = element.get_text(strip=True)
+            if date_text:
+                return date_text
         
         # Look for date patterns in meta tags
-        meta_selectors = [
-            'meta[property="article:published_time"]',
-            'meta[name="publishdate"]',
-            'meta[name="date"]'
+        if meta is None:
+            meta = self._meta_index(soup)
+        
+        meta_keys = [
+            ('property', 'article:published_time'),
+            ('name', 'publishdate'),
+            ('name', 'date')
         ]
         
-        for selector in meta_selectors:
-            element = soup.select_one(selector)
-            if element:
-                content = element.get('content')
-                if content:
-                    return content
+        for key in meta_keys:
+            content = meta.get(key)
+            if content:
+                return content
         
         return datetime.now().strftime('%Y-%m-%d')
     
-    def _extract_main_image(self, soup: BeautifulSoup, article_url: str) -> str:
+    def _extract_main_image(self, soup: BeautifulSoup, article_url: str, meta: Dict = None,
+                            json_scripts: list = None) -> str:
         """Extract the main article image"""
-        self.logger.debug(f"Extracting images for: {article_url}")
+        self.logger.debug("Extracting images for: %s", article_url)
         
         # First try meta tags
-        meta_image = self._extract_meta_image(soup)
+        meta_image = self._extract_meta_image(soup, meta)
         if meta_image:
             return meta_image
         
         # Try JSON-LD structured data
-        json_scripts = soup.find_all('script', type='application/ld+json')
+        if json_scripts is None:
+            json_scripts = soup.find_all('script', type='application/ld+json')
         for script in json_scripts:
             try:
-                import json
-                data = json.loads(script.string)
-                if isinstance(data, dict):
-                    image = data.get('image') or data.get('thumbnailUrl')
+                # orjson only takes exact str, not bs4's NavigableString subclass
+                data = _json_loads(str(script.string))
+                for node in _json_ld_nodes(data):
+                    image = node.get('image') or node.get('thumbnailUrl')
                     if image:
                         if isinstance(image, list) and image:
                             image = image[0]
@@ -322,29 +372,21 @@ class ProthomAloScraper(BaseScraper):
                             image = image.get('url') or image.get('@url')
                         if image and self._is_valid_image_url(str(image)):
                             return self._normalize_url(str(image))
-            except:
+            except (ValueError, TypeError, AttributeError):
+                # Malformed or empty JSON-LD (both decoders raise ValueError subclasses)
                 continue
         
-        # Try various image selectors
-        image_selectors = [
-            'img[width][height]',
-            '.story-element img',
-            '.article-image img',
-            '.content-image img',
-            '.featured-image img',
-            '.hero-image img',
-            'figure img',
-            'picture img',
-            '.story-content img',
-            'article img',
-            'main img'
-        ]
-        
-        for selector in image_selectors:
-            elements = soup.select(selector)
+        # Try various image selectors; the later, broader ones repeat images the
+        # earlier ones already rejected, and the checks do not depend on the selector
+        checked = set()
+        for elements in _IMAGE_SELECTORS.select(soup):
             for element in elements:
-                src = (element.get('src') or element.get('data-src') or 
-                      element.get('data-lazy-src') or element.get('data-original'))
+                if id(element) in checked:
+                    continue
+                checked.add(id(element))
+                
+                # One pass over the tag's attribute dict; empty values are skipped like before
+                src = next(filter(None, map(element.attrs.get, _SRC_ATTRS)), None)
                 
                 if src:
                     normalized_url = self._normalize_url(src)
@@ -373,27 +415,13 @@ class ProthomAloScraper(BaseScraper):
         # Check alt text
         alt_text = img_element.get('alt', '').lower()
         if alt_text and len(alt_text) > 5:
-            if not any(word in alt_text for word in ['logo', 'icon', 'share', 'social']):
+            if not _CHROME_ALT_RE.search(alt_text):
                 return True
         
         # Check image filename
-        src_lower = src.lower()
-        if any(term in src_lower for term in ['main', 'feature', 'hero', 'lead', 'primary']):
-            return True
-        
-        # Check parent elements
-        parent_classes = []
-        parent = img_element.parent
-        level = 0
-        while parent and level < 5:
-            if hasattr(parent, 'get') and parent.get('class'):
-                parent_classes.extend(parent.get('class'))
-            parent = getattr(parent, 'parent', None)
-            level += 1
-        
-        parent_class_text = ' '.join(parent_classes).lower()
-        article_indicators = ['story', 'article', 'content', 'main', 'featured', 'hero']
-        if any(indicator in parent_class_text for indicator in article_indicators):
+        if _MAIN_IMAGE_SRC_RE.search(src.lower()):
             return True
         
-        return True  # Default to accepting images unless clearly excluded
\ No newline at end of file
+        # Images are accepted unless clearly excluded above, so an article-like
+        # ancestor class would not change the answer; skip walking the parents
+        return True
\ No newline at end of file
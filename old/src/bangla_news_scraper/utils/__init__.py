@@ -2,11 +2,75 @@
 Logging utilities for the Bangla News Scraper
 """
 
+import atexit
 import logging
+import queue
 import sys
-from typing import Optional
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional
 from ..config import Config
 
+# Loggers already configured by setup_logger, keyed by name
+_configured: Dict[str, logging.Logger] = {}
+
+
+class _TargetedQueueHandler(QueueHandler):
+    """Queue handler that tags each record with the handlers of the logger it serves"""
+    
+    def __init__(self, log_queue: queue.SimpleQueue, targets: List[logging.Handler]):
+        """Enqueue onto the shared queue on behalf of the given handlers"""
+        super().__init__(log_queue)
+        self.targets = targets
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Format the record for the queue and attach the handlers that should write it"""
+        record = super().prepare(record)
+        record.targets = self.targets
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queue the record, starting the shared listener on first use"""
+        if _listener is None:
+            _ensure_listener()
+        super().enqueue(record)
+
+
+class _Dispatcher(logging.Handler):
+    """Hand each dequeued record to the handlers it was tagged with"""
+    
+    def handle(self, record: logging.LogRecord) -> bool:
+        """Write the record with each tagged handler whose level it reaches"""
+        for handler in record.targets:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+
+# One queue and one background thread write the records of every configured logger;
+# modules create their loggers on import, so the thread only starts with the first record
+_log_queue = queue.SimpleQueue()
+_listener: Optional[QueueListener] = None
+_listener_lock = threading.RLock()
+
+
+def _ensure_listener() -> None:
+    """Start the shared listener thread if it is not running yet"""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            _listener = QueueListener(_log_queue, _Dispatcher())
+            _listener.start()
+            # Flush queued records before the interpreter exits
+            atexit.register(_listener.stop)
+
+
+def _drain_listener() -> None:
+    """Write out every record queued so far, then keep listening"""
+    if _listener is not None:
+        _listener.stop()
+        _listener.start()
+
 
 def setup_logger(
     name: str = "bangla_news_scraper",
@@ -17,6 +81,10 @@ def setup_logger(
     """
     Set up a logger with the specified configuration
     
+    Records are put on a queue and written to the console/file by a background
+    listener thread shared by all loggers, so logging never blocks the scraping
+    threads on I/O.
+    
     Args:
         name: Logger name
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -34,9 +102,17 @@ def setup_logger(
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper()))
     
-    # Remove existing handlers to avoid duplicates
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
+    with _listener_lock:
+        # Remove existing handlers to avoid duplicates; detach them first, then let the
+        # listener write what is already queued for them, so nothing is written after close
+        old_handlers = list(logger.handlers)
+        logger.handlers.clear()
+        if old_handlers:
+            _drain_listener()
+        for handler in old_handlers:
+            for target in getattr(handler, 'targets', ()):
+                target.close()
+            handler.close()
     
     # Create formatter
     formatter = logging.Formatter(format_str)
@@ -44,20 +120,29 @@ def setup_logger(
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # File handler (optional)
     if log_file:
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # The logger itself only enqueues; the shared listener does the writing
+    logger.addHandler(_TargetedQueueHandler(_log_queue, handlers))
+    _configured[name] = logger
     
     return logger
 
 
 def get_logger(name: str = "bangla_news_scraper") -> logging.Logger:
     """Get an existing logger or create a new one with default settings"""
+    logger = _configured.get(name)
+    if logger is not None:
+        return logger
+    
     logger = logging.getLogger(name)
     if not logger.handlers:
         return setup_logger(name)
+    _configured[name] = logger
     return logger
\ No newline at end of file
@@ -2,18 +2,136 @@
 Simple file-based caching for scraped articles
 """
 
+import atexit
 import os
 import json
 import hashlib
+import queue
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Tuple
 from ..config import Config
 from ..models import Article
 from ..exceptions import CacheException
 from ..utils import get_logger
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:  # pragma: no cover - optional dependency
+    requests_cache = None
+
 logger = get_logger(__name__)
 
+# Articles each cache keeps decoded in memory, least recently used dropped first
+_MEMORY_SIZE = 1024
+
+
+def _dumps(data) -> bytes:
+    """Encode a cache entry as UTF-8 JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(raw: bytes):
+    """Decode a cache entry"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Cache files waiting to be written, as (path, encoded entry, url), and the
+# background thread writing them; started on the first write
+_write_queue: queue.Queue = queue.Queue()
+_writer_lock = threading.Lock()
+_writer: Optional[threading.Thread] = None
+
+
+def _write_entries() -> None:
+    """Write queued cache files one by one, off the scraping threads"""
+    while True:
+        path, data, url = _write_queue.get()
+        try:
+            with open(path, 'wb') as f:
+                f.write(data)
+            logger.debug("Cached article: %s", url)
+        except OSError as e:
+            logger.warning("Failed to cache article %s: %s", url, e)
+        finally:
+            _write_queue.task_done()
+
+
+def _queue_write(path: str, data: bytes, url: str) -> None:
+    """Hand a cache file to the background writer, starting it if needed"""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = threading.Thread(target=_write_entries, name='article-cache-writer', daemon=True)
+            _writer.start()
+    _write_queue.put((path, data, url))
+
+
+@atexit.register
+def _flush_writes() -> None:
+    """Block until every queued cache file has been written"""
+    _write_queue.join()
+
+
+def _open_http_cache() -> Optional[Any]:
+    """requests-cache store behind Config.HTTP_CACHE_NAME, or None if it was never created"""
+    if requests_cache is None:
+        return None
+    # requests-cache adds the extension to the name; check first so nothing is created
+    if not os.path.exists(Config.HTTP_CACHE_NAME + '.sqlite'):
+        return None
+    return requests_cache.SQLiteCache(Config.HTTP_CACHE_NAME)
+
+
+def http_cache_stats() -> Optional[dict]:
+    """Response count and on-disk size of the HTTP cache, or None when there is none to report"""
+    if not Config.CACHE_ENABLED:
+        return None
+    cache = _open_http_cache()
+    if cache is None:
+        return None
+    
+    try:
+        return {
+            'responses': len(cache.responses),
+            'size_mb': round(os.path.getsize(cache.db_path) / (1024 * 1024), 2)
+        }
+    finally:
+        cache.close()
+
+
+def clear_http_cache() -> int:
+    """Drop every response from the HTTP cache and return how many there were"""
+    cache = _open_http_cache()
+    if cache is None:
+        return 0
+    
+    try:
+        count = len(cache.responses)
+        cache.clear()
+    finally:
+        cache.close()
+    logger.info("Cleared %s cached HTTP responses", count)
+    return count
+
+
+@lru_cache(maxsize=4096)
+def _cache_key(url: str) -> str:
+    """Hash a URL into a cache key; module-level so the LRU does not hold cache instances"""
+    return hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+
 
 class ArticleCache:
     """Simple file-based cache for articles"""
@@ -21,6 +139,9 @@ class ArticleCache:
     def __init__(self, cache_dir: str = None, cache_duration_hours: int = None):
         self.cache_dir = cache_dir or Config.CACHE_DIR
         self.cache_duration = timedelta(hours=cache_duration_hours or Config.CACHE_DURATION_HOURS)
+        # URL -> (file modification time, article), so repeat hits skip the file read and decode
+        self._memory: 'OrderedDict[str, Tuple[float, Article]]' = OrderedDict()
+        self._memory_lock = threading.Lock()
         self._ensure_cache_dir()
     
     def _ensure_cache_dir(self):
@@ -32,7 +153,7 @@ class ArticleCache:
     
     def _get_cache_key(self, url: str) -> str:
         """Generate cache key from URL"""
-        return hashlib.md5(url.encode('utf-8')).hexdigest()
+        return _cache_key(url)
     
     def _get_cache_path(self, cache_key: str) -> str:
         """Get full path to cache file"""
@@ -49,11 +170,41 @@ class ArticleCache:
         except OSError:
             return False
     
+    def _expiry_cutoff(self) -> float:
+        """Modification timestamp at or before which a cache file counts as expired"""
+        return (datetime.now() - self.cache_duration).timestamp()
+    
+    def _remember(self, url: str, modified: float, article: Article) -> None:
+        """Keep a decoded article in memory, evicting the least recently used beyond the cap"""
+        with self._memory_lock:
+            self._memory[url] = (modified, article)
+            self._memory.move_to_end(url)
+            if len(self._memory) > _MEMORY_SIZE:
+                self._memory.popitem(last=False)
+    
+    def _recall(self, url: str) -> Optional[Article]:
+        """Article held in memory for a URL, if its file would still be valid"""
+        with self._memory_lock:
+            entry = self._memory.get(url)
+            if entry is None:
+                return None
+            modified, article = entry
+            if time.time() - modified >= self.cache_duration.total_seconds():
+                del self._memory[url]
+                return None
+            self._memory.move_to_end(url)
+            return article
+    
     def get(self, url: str) -> Optional[Article]:
         """Get article from cache if available and valid"""
         if not Config.CACHE_ENABLED:
             return None
         
+        article = self._recall(url)
+        if article is not None:
+            logger.debug("Memory cache hit for %s", url)
+            return article
+        
         cache_key = self._get_cache_key(url)
         cache_path = self._get_cache_path(cache_key)
         
@@ -61,13 +212,14 @@ class ArticleCache:
             return None
         
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(cache_path, 'rb') as f:
+                data = _loads(f.read())
                 article = Article.from_dict(data)
-                logger.debug(f"Cache hit for {url}")
+                self._remember(url, os.fstat(f.fileno()).st_mtime, article)
+                logger.debug("Cache hit for %s", url)
                 return article
         except (OSError, json.JSONDecodeError, TypeError) as e:
-            logger.warning(f"Failed to read cache for {url}: {e}")
+            logger.warning("Failed to read cache for %s: %s", url, e)
             # Remove corrupted cache file
             try:
                 os.remove(cache_path)
@@ -83,16 +235,20 @@ class ArticleCache:
         cache_key = self._get_cache_key(url)
         cache_path = self._get_cache_path(cache_key)
         
-        try:
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(article.to_dict(), f, ensure_ascii=False, indent=2)
-            logger.debug(f"Cached article: {url}")
-        except OSError as e:
-            logger.warning(f"Failed to cache article {url}: {e}")
+        # Encode now, write in the background; the memory layer answers until the file lands
+        _queue_write(cache_path, _dumps(article.to_dict()), url)
+        self._remember(url, time.time(), article)
+    
+    def flush(self) -> None:
+        """Wait for pending cache writes to reach disk"""
+        _flush_writes()
     
     def clear(self) -> int:
         """Clear all cached articles"""
         cleared_count = 0
+        self.flush()
+        with self._memory_lock:
+            self._memory.clear()
         
         if not os.path.exists(self.cache_dir):
             return cleared_count
@@ -105,38 +261,47 @@ class ArticleCache:
                         os.remove(file_path)
                         cleared_count += 1
                     except OSError as e:
-                        logger.warning(f"Failed to remove cache file {file_path}: {e}")
+                        logger.warning("Failed to remove cache file %s: %s", file_path, e)
         except OSError as e:
             raise CacheException(f"Failed to list cache directory: {e}")
         
-        logger.info(f"Cleared {cleared_count} cached articles")
+        logger.info("Cleared %s cached articles", cleared_count)
         return cleared_count
     
     def clear_expired(self) -> int:
         """Clear only expired cached articles"""
         cleared_count = 0
+        self.flush()
         
         if not os.path.exists(self.cache_dir):
             return cleared_count
         
+        cutoff = self._expiry_cutoff()
         try:
-            for filename in os.listdir(self.cache_dir):
-                if filename.endswith('.json'):
-                    file_path = os.path.join(self.cache_dir, filename)
-                    if not self._is_cache_valid(file_path):
+            # scandir gives each entry's path and a single stat() without extra lookups
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.json'):
+                        continue
+                    try:
+                        expired = entry.stat().st_mtime <= cutoff
+                    except OSError:
+                        expired = True
+                    if expired:
                         try:
-                            os.remove(file_path)
+                            os.remove(entry.path)
                             cleared_count += 1
                         except OSError as e:
-                            logger.warning(f"Failed to remove expired cache file {file_path}: {e}")
+                            logger.warning("Failed to remove expired cache file %s: %s", entry.path, e)
         except OSError as e:
             raise CacheException(f"Failed to list cache directory: {e}")
         
-        logger.info(f"Cleared {cleared_count} expired cached articles")
+        logger.info("Cleared %s expired cached articles", cleared_count)
         return cleared_count
     
     def get_cache_stats(self) -> dict:
         """Get cache statistics"""
+        self.flush()
         if not os.path.exists(self.cache_dir):
             return {
                 'total_files': 0,
@@ -150,20 +315,25 @@ class ArticleCache:
         expired_files = 0
         total_size = 0
         
+        cutoff = self._expiry_cutoff()
         try:
-            for filename in os.listdir(self.cache_dir):
-                if filename.endswith('.json'):
-                    file_path = os.path.join(self.cache_dir, filename)
+            # One stat() per entry supplies both the size and the age
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.json'):
+                        continue
                     total_files += 1
                     
                     try:
-                        total_size += os.path.getsize(file_path)
-                        if self._is_cache_valid(file_path):
-                            valid_files += 1
-                        else:
-                            expired_files += 1
+                        stat = entry.stat()
                     except OSError:
                         expired_files += 1
+                        continue
+                    total_size += stat.st_size
+                    if stat.st_mtime > cutoff:
+                        valid_files += 1
+                    else:
+                        expired_files += 1
         except OSError:
             pass
         
@@ -2,6 +2,7 @@
 Enhanced CLI visuals and styling utilities for Bangla News Scraper
 """
 
+import os
 import time
 from typing import Dict, List, Optional
 from rich.console import Console
@@ -28,17 +29,19 @@ class CLITheme:
     MUTED = "dim white"
     HIGHLIGHT = "bright_yellow"
 
+# The banner never changes, so build its renderable once at import
+_BANNER = Panel(
+    Align.center(
+        Text("BANGLA NEWS SCRAPER", style=f"bold {CLITheme.PRIMARY}")
+    ),
+    box=box.DOUBLE,
+    border_style=CLITheme.PRIMARY,
+    padding=(1, 2)
+)
+
 def print_banner():
     """Display the application banner"""
-    banner = Panel(
-        Align.center(
-            Text("BANGLA NEWS SCRAPER", style=f"bold {CLITheme.PRIMARY}")
-        ),
-        box=box.DOUBLE,
-        border_style=CLITheme.PRIMARY,
-        padding=(1, 2)
-    )
-    console.print(banner)
+    console.print(_BANNER)
 
 def print_separator():
     """Print a stylized separator"""
@@ -73,8 +76,8 @@ def print_config_info(site: str, limit: int, output: str, output_dir: str, delay
     
     console.print(Panel(table, title="Configuration", border_style=CLITheme.INFO))
 
-def print_cache_stats(stats: Dict):
-    """Display cache statistics in a formatted table"""
+def print_cache_stats(stats: Dict, http_stats: Optional[Dict] = None):
+    """Display article (and HTTP response) cache statistics in a formatted table"""
     table = Table(show_header=False, box=box.SIMPLE, padding=(0, 1))
     table.add_column("Metric", style=CLITheme.INFO)
     table.add_column("Value", style="white")
@@ -83,6 +86,9 @@ def print_cache_stats(stats: Dict):
     table.add_row("✅ Valid Files", str(stats['valid_files']))
     table.add_row("⏰ Expired Files", str(stats['expired_files']))
     table.add_row("💾 Total Size", f"{stats['total_size_mb']} MB")
+    if http_stats is not None:
+        table.add_row("🌐 HTTP Responses", str(http_stats['responses']))
+        table.add_row("🗄️  HTTP Cache Size", f"{http_stats['size_mb']} MB")
     
     console.print(Panel(table, title="📊 Cache Statistics", border_style=CLITheme.INFO))
 
@@ -139,7 +145,7 @@ def print_overall_summary(sites_count: int, total_articles: int, total_duration:
 
 def print_file_saved(site_name: str, filepath: str):
     """Print file save confirmation"""
-    filename = filepath.split('\\')[-1] if '\\' in filepath else filepath.split('/')[-1]
+    filename = os.path.basename(filepath)
     console.print(f"💾 [bold]{site_name}[/bold]: Saved to [link]{filename}[/link]", style=CLITheme.SUCCESS)
 
 def create_progress_bar(description: str = "Processing"):
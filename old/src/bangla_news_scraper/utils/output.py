@@ -5,21 +5,66 @@ Output utilities for saving scraped news articles
 import json
 import csv
 import os
+from dataclasses import replace
 from datetime import datetime
+from operator import attrgetter
 from typing import List, Union
+from ..config import Config
 from ..models import Article, ScrapingResult
 from ..utils import get_logger
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 logger = get_logger(__name__)
 
 
+def _dump_json(data) -> bytes:
+    """Serialize to indented UTF-8 JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def _write_articles_json(f, articles: List[Article], depth: int = 0) -> None:
+    """Write articles as an indented JSON array, serializing one record at a time"""
+    if not articles:
+        f.write(b'[]')
+        return
+    
+    # Same layout a single indent=2 dump would give, nested `depth` levels deep
+    pad = b'\n' + b'  ' * (depth + 1)
+    f.write(b'[')
+    for i, article in enumerate(articles):
+        f.write((b',' if i else b'') + pad + _dump_json(article.to_dict()).replace(b'\n', pad))
+    f.write(pad[:-2] + b']')
+
+
+def _write_result_json(f, result: ScrapingResult) -> None:
+    """Write a scraping result as an indented JSON object, streaming its articles array"""
+    # Summary fields come from to_dict() itself, with the articles left out of the dump
+    fields = replace(result, articles=[]).to_dict()
+    pad = b'\n  '
+    f.write(b'{')
+    for i, (key, value) in enumerate(fields.items()):
+        f.write((b',' if i else b'') + pad + _dump_json(key) + b': ')
+        if key == 'articles':
+            _write_articles_json(f, result.articles, depth=1)
+        else:
+            f.write(_dump_json(value).replace(b'\n', pad))
+    f.write(b'\n}')
+
+
 def save_to_json(
     data: Union[List[Article], ScrapingResult], 
     site_name: str, 
-    output_dir: str = "output"
+    output_dir: str = "output",
+    timestamp: str = None
 ) -> str:
     """Save articles or scraping result to JSON file with UTF-8 encoding"""
-    timestamp = datetime.now().strftime('%Y-%m-%d')
+    timestamp = timestamp or datetime.now().strftime('%Y-%m-%d')
     filename = f"{timestamp}_{site_name}.json"
     # Create json subdirectory within output directory
     json_dir = os.path.join(output_dir, "json")
@@ -29,31 +74,31 @@ def save_to_json(
         # Ensure output directory exists
         os.makedirs(json_dir, exist_ok=True)
         
-        # Convert to dictionary format
-        if isinstance(data, ScrapingResult):
-            json_data = data.to_dict()
-        else:
-            json_data = [article.to_dict() for article in data]
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, ensure_ascii=False, indent=2)
+        # Stream the articles record by record into a large write buffer
+        # rather than building the whole document in memory first
+        with open(filepath, 'wb', buffering=Config.OUTPUT_BUFFER_SIZE) as f:
+            if isinstance(data, ScrapingResult):
+                _write_result_json(f, data)
+            else:
+                _write_articles_json(f, data)
         
         count = len(data.articles) if isinstance(data, ScrapingResult) else len(data)
-        logger.info(f"Saved {count} articles to {filepath}")
+        logger.info("Saved %s articles to %s", count, filepath)
         return filepath
         
     except Exception as e:
-        logger.error(f"Error saving to JSON: {e}")
+        logger.error("Error saving to JSON: %s", e)
         raise
 
 
 def save_to_csv(
     data: Union[List[Article], ScrapingResult], 
     site_name: str, 
-    output_dir: str = "output"
+    output_dir: str = "output",
+    timestamp: str = None
 ) -> str:
     """Save articles to CSV file with UTF-8 encoding"""
-    timestamp = datetime.now().strftime('%Y-%m-%d')
+    timestamp = timestamp or datetime.now().strftime('%Y-%m-%d')
     filename = f"{timestamp}_{site_name}.csv"
     # Create csv subdirectory within output directory
     csv_dir = os.path.join(output_dir, "csv")
@@ -76,29 +121,21 @@ def save_to_csv(
             'image_url', 'site_name', 'scraped_at'
         ]
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for article in articles:
-                # Clean content for CSV (remove newlines that might break formatting)
-                article_dict = article.to_dict()
-                cleaned_article = {}
-                
-                for key, value in article_dict.items():
-                    if isinstance(value, str):
-                        # Replace newlines with spaces for CSV compatibility
-                        cleaned_article[key] = value.replace('\n', ' ').replace('\r', ' ')
-                    else:
-                        cleaned_article[key] = value
-                
-                writer.writerow(cleaned_article)
+        # Plain tuples straight off the articles, produced one row at a time
+        row = attrgetter(*fieldnames)
+        
+        # Quote every field so multi-line content stays inside its row
+        with open(filepath, 'w', newline='', encoding='utf-8',
+                  buffering=Config.OUTPUT_BUFFER_SIZE) as f:
+            writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+            writer.writerow(fieldnames)
+            writer.writerows(map(row, articles))
         
-        logger.info(f"Saved {len(articles)} articles to {filepath}")
+        logger.info("Saved %s articles to %s", len(articles), filepath)
         return filepath
         
     except Exception as e:
-        logger.error(f"Error saving to CSV: {e}")
+        logger.error("Error saving to CSV: %s", e)
         raise
 
 
@@ -155,12 +192,14 @@ def display_articles_summary(data: Union[List[Article], ScrapingResult]) -> None
 def validate_articles(articles: List[Article]) -> List[Article]:
     """Validate and filter article data"""
     valid_articles = []
+    append = valid_articles.append
     
+    # is_valid() already short-circuits on title, then content, then URL
     for article in articles:
         if article.is_valid():
-            valid_articles.append(article)
+            append(article)
         else:
-            logger.warning(f"Skipping invalid article: {article.url}")
+            logger.warning("Skipping invalid article: %s", article.url)
     
-    logger.info(f"Validated {len(valid_articles)} out of {len(articles)} articles")
+    logger.info("Validated %d out of %d articles", len(valid_articles), len(articles))
     return valid_articles
\ No newline at end of file
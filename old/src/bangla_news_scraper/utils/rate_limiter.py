@@ -0,0 +1,140 @@
+"""
+Per-host rate limiting for polite scraping
+"""
+
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional, Set, Tuple
+
+# Spacing a throttled host starts doubling from, for limiters with little or no delay
+_MIN_THROTTLE_INTERVAL = 0.5
+
+# Each successful request shrinks a throttled host's spacing by this factor
+_RECOVERY_FACTOR = 0.9
+
+
+def _wake(future: asyncio.Future) -> None:
+    """Resolve a sleeping acquire_async() future, unless it already finished"""
+    if not future.done():
+        future.set_result(None)
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Read a Retry-After header (delta seconds or HTTP date) as seconds to wait"""
+    value = headers.get('Retry-After')
+    if not value:
+        return None
+    
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class HostRateLimiter:
+    """Space out requests to each host by a minimum interval, widened while a host pushes back"""
+    
+    def __init__(self, interval: float, max_interval: float = 60.0):
+        self.interval = interval
+        self.max_interval = max_interval
+        self._next_slot: Dict[str, float] = {}
+        # Only hosts that have been throttled get an entry; the rest use self.interval
+        self._host_interval: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        # Set by stop() to wake sleeping acquire() calls, e.g. on Ctrl-C
+        self._stopped = threading.Event()
+        # Futures acquire_async() sleeps on, with their loops, so stop() can resolve them
+        self._async_waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = set()
+    
+    def _reserve(self, host: str) -> float:
+        """Reserve the next request slot for a host and return the seconds to wait"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + self._host_interval.get(host, self.interval)
+            return slot - now
+    
+    def host_interval(self, host: str) -> float:
+        """Current spacing between requests to a host"""
+        with self._lock:
+            return self._host_interval.get(host, self.interval)
+    
+    def throttle(self, host: str) -> None:
+        """Double a host's spacing after it signals overload (429/503)"""
+        with self._lock:
+            current = max(self._host_interval.get(host, self.interval), _MIN_THROTTLE_INTERVAL)
+            self._host_interval[host] = min(self.max_interval, current * 2)
+    
+    def relax(self, host: str) -> None:
+        """Ease a throttled host back towards the base interval after a success"""
+        with self._lock:
+            current = self._host_interval.get(host)
+            if current is None:
+                return
+            current *= _RECOVERY_FACTOR
+            if current <= self.interval:
+                del self._host_interval[host]
+            else:
+                self._host_interval[host] = current
+    
+    def defer(self, host: str, seconds: float) -> None:
+        """Hold back all requests to a host for the given number of seconds"""
+        with self._lock:
+            resume = time.monotonic() + seconds
+            self._next_slot[host] = max(self._next_slot.get(host, 0.0), resume)
+    
+    @property
+    def stopped(self) -> bool:
+        """Whether stop() has been called"""
+        return self._stopped.is_set()
+    
+    def stop(self) -> None:
+        """Wake every blocked acquire() or acquire_async() and let later calls return at once"""
+        self._stopped.set()
+        with self._lock:
+            waiters = list(self._async_waiters)
+        for loop, woken in waiters:
+            try:
+                # stop() may run on any thread; futures are only touched from their own loop
+                loop.call_soon_threadsafe(_wake, woken)
+            except RuntimeError:
+                # The loop has already closed
+                pass
+    
+    def acquire(self, host: str) -> None:
+        """Block until a request to the host is allowed, or until the limiter is stopped"""
+        wait = self._reserve(host)
+        if wait > 0:
+            self._stopped.wait(wait)
+    
+    async def acquire_async(self, host: str) -> None:
+        """Wait without blocking the event loop until a request to the host is allowed"""
+        wait = self._reserve(host)
+        if wait <= 0:
+            return
+        
+        loop = asyncio.get_running_loop()
+        woken = loop.create_future()
+        waiter = (loop, woken)
+        with self._lock:
+            self._async_waiters.add(waiter)
+        try:
+            # Checked after registering, so a concurrent stop() is never missed
+            if self.stopped:
+                return
+            # Sleep out the wait, unless stop() resolves the future first
+            await asyncio.wait_for(woken, wait)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._lock:
+                self._async_waiters.discard(waiter)
\ No newline at end of file
@@ -0,0 +1,130 @@
+"""
+Tests for output utilities
+"""
+
+import csv
+import json
+import os
+from datetime import datetime
+from bangla_news_scraper.models import Article, ScrapingResult
+from bangla_news_scraper.utils import output
+from bangla_news_scraper.utils.output import save_to_json, save_to_csv
+from .conftest import SAMPLE_ARTICLE_DATA
+
+
+class TestSaveToJson:
+    """Test JSON output"""
+    
+    def test_save_article_list(self, temp_dir):
+        """Test saving a plain list of articles"""
+        articles = [Article(**SAMPLE_ARTICLE_DATA), Article(**SAMPLE_ARTICLE_DATA)]
+        filepath = save_to_json(articles, 'test-site', temp_dir)
+        
+        assert os.path.exists(filepath)
+        with open(filepath, encoding='utf-8') as f:
+            data = json.load(f)
+        assert len(data) == 2
+        assert data[0]['title'] == SAMPLE_ARTICLE_DATA['title']
+    
+    def test_save_scraping_result_keeps_unicode(self, temp_dir):
+        """Test that Bangla text is written as UTF-8, not escaped"""
+        article_data = dict(SAMPLE_ARTICLE_DATA, title='প্রথম আলো শিরোনাম')
+        result = ScrapingResult(
+            articles=[Article(**article_data)],
+            site_name='test-site',
+            total_requested=1,
+            total_found=1,
+            total_valid=1,
+            scraped_at=datetime.now().isoformat()
+        )
+        filepath = save_to_json(result, 'test-site', temp_dir)
+        
+        with open(filepath, encoding='utf-8') as f:
+            raw = f.read()
+        assert 'প্রথম আলো শিরোনাম' in raw
+        assert json.loads(raw)['articles'][0]['title'] == 'প্রথম আলো শিরোনাম'
+    
+    def test_stdlib_fallback_matches(self, temp_dir, monkeypatch):
+        """Test that output without orjson decodes to the same data"""
+        articles = [Article(**SAMPLE_ARTICLE_DATA)]
+        with open(save_to_json(articles, 'fast', temp_dir), encoding='utf-8') as f:
+            fast = json.load(f)
+        
+        monkeypatch.setattr(output, 'orjson', None)
+        with open(save_to_json(articles, 'plain', temp_dir), encoding='utf-8') as f:
+            plain = json.load(f)
+        
+        assert fast == plain
+    
+    def test_streamed_layout_matches_single_dump(self, temp_dir, monkeypatch):
+        """Test that record-by-record output is byte-identical to one indented dump"""
+        monkeypatch.setattr(output, 'orjson', None)
+        result = ScrapingResult(
+            articles=[Article(**SAMPLE_ARTICLE_DATA), Article(**SAMPLE_ARTICLE_DATA)],
+            site_name='test-site',
+            total_requested=2,
+            total_found=2,
+            total_valid=2,
+            scraped_at=datetime.now().isoformat(),
+            duration_seconds=1.5
+        )
+        
+        for data in (result, result.articles, []):
+            expected = data.to_dict() if isinstance(data, ScrapingResult) else [a.to_dict() for a in data]
+            with open(save_to_json(data, 'test-site', temp_dir), encoding='utf-8') as f:
+                assert f.read() == json.dumps(expected, ensure_ascii=False, indent=2)
+    
+    def test_result_layout_follows_to_dict(self, temp_dir, monkeypatch):
+        """Test that result output keeps to_dict()'s keys and order wherever 'articles' sits"""
+        monkeypatch.setattr(output, 'orjson', None)
+        original = ScrapingResult.to_dict
+        
+        def reordered(self):
+            data = original(self)
+            articles = data.pop('articles')
+            return {'tags': [], **data, 'articles': articles}
+        
+        monkeypatch.setattr(ScrapingResult, 'to_dict', reordered)
+        result = ScrapingResult(
+            articles=[Article(**SAMPLE_ARTICLE_DATA)],
+            site_name='test-site',
+            total_requested=1,
+            total_found=1,
+            total_valid=1,
+            scraped_at=datetime.now().isoformat(),
+            duration_seconds=1.5
+        )
+        
+        with open(save_to_json(result, 'test-site', temp_dir), encoding='utf-8') as f:
+            assert f.read() == json.dumps(result.to_dict(), ensure_ascii=False, indent=2)
+
+
+class TestSaveToCsv:
+    """Test CSV output"""
+    
+    def test_save_article_list(self, temp_dir):
+        """Test saving articles as CSV rows"""
+        articles = [Article(**SAMPLE_ARTICLE_DATA), Article(**SAMPLE_ARTICLE_DATA)]
+        filepath = save_to_csv(articles, 'test-site', temp_dir)
+        
+        with open(filepath, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 2
+        assert rows[0]['title'] == SAMPLE_ARTICLE_DATA['title']
+        assert rows[0]['url'] == SAMPLE_ARTICLE_DATA['url']
+    
+    def test_no_articles(self, temp_dir):
+        """Test that nothing is written for an empty article list"""
+        filepath = save_to_csv([], 'test-site', temp_dir)
+        assert not os.path.exists(filepath)
+    
+    def test_multiline_content_round_trips(self, temp_dir):
+        """Test that newlines in content survive as a single quoted field"""
+        content = SAMPLE_ARTICLE_DATA['content'] + '\n\nদ্বিতীয় অনুচ্ছেদ'
+        articles = [Article(**dict(SAMPLE_ARTICLE_DATA, content=content))]
+        filepath = save_to_csv(articles, 'test-site', temp_dir)
+        
+        with open(filepath, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 1
+        assert rows[0]['content'] == content
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""
+Tests for per-host rate limiting
+"""
+
+import asyncio
+import threading
+import time
+from email.utils import formatdate
+from bangla_news_scraper.utils.rate_limiter import HostRateLimiter, parse_retry_after
+
+
+class TestHostRateLimiter:
+    """Test HostRateLimiter functionality"""
+    
+    def test_first_request_is_immediate(self):
+        """Test that the first request to a host does not wait"""
+        limiter = HostRateLimiter(interval=0.5)
+        start = time.monotonic()
+        limiter.acquire("example.com")
+        assert time.monotonic() - start < 0.1
+    
+    def test_requests_to_same_host_are_spaced(self):
+        """Test that consecutive requests to one host respect the interval"""
+        limiter = HostRateLimiter(interval=0.05)
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.acquire("example.com")
+        assert time.monotonic() - start >= 0.1
+    
+    def test_hosts_are_independent(self):
+        """Test that different hosts do not throttle each other"""
+        limiter = HostRateLimiter(interval=0.5)
+        start = time.monotonic()
+        limiter.acquire("a.example.com")
+        limiter.acquire("b.example.com")
+        assert time.monotonic() - start < 0.1
+    
+    def test_acquire_async(self):
+        """Test that the async variant also spaces requests"""
+        limiter = HostRateLimiter(interval=0.05)
+        
+        async def run():
+            for _ in range(3):
+                await limiter.acquire_async("example.com")
+        
+        start = time.monotonic()
+        asyncio.run(run())
+        assert time.monotonic() - start >= 0.1
+    
+    def test_defer_holds_back_host(self):
+        """Test that a deferred host waits before its next request"""
+        limiter = HostRateLimiter(interval=0.0)
+        limiter.defer("example.com", 0.1)
+        start = time.monotonic()
+        limiter.acquire("example.com")
+        assert time.monotonic() - start >= 0.09
+    
+    def test_stop_wakes_blocked_acquire(self):
+        """Test that stop() releases a thread waiting for its slot"""
+        limiter = HostRateLimiter(interval=0.0)
+        limiter.defer("example.com", 10)
+        waiter = threading.Thread(target=limiter.acquire, args=("example.com",))
+        start = time.monotonic()
+        waiter.start()
+        limiter.stop()
+        waiter.join(timeout=1)
+        assert not waiter.is_alive()
+        assert limiter.stopped
+        assert time.monotonic() - start < 1
+    
+    def test_stop_wakes_async_acquire(self):
+        """Test that stop() from another thread releases coroutines waiting for their slot"""
+        limiter = HostRateLimiter(interval=0.0)
+        limiter.defer("example.com", 10)
+        
+        async def wait_all():
+            threading.Timer(0.05, limiter.stop).start()
+            await asyncio.gather(*(limiter.acquire_async("example.com") for _ in range(3)))
+        
+        start = time.monotonic()
+        asyncio.run(wait_all())
+        assert time.monotonic() - start < 1
+    
+    def test_throttle_widens_and_relax_recovers(self):
+        """Test that a throttled host is spaced out further, then eases back to the base interval"""
+        limiter = HostRateLimiter(interval=1.0, max_interval=3.0)
+        limiter.throttle("example.com")
+        assert limiter.host_interval("example.com") == 2.0
+        assert limiter.host_interval("other.example.com") == 1.0
+        
+        limiter.throttle("example.com")
+        assert limiter.host_interval("example.com") == 3.0
+        
+        for _ in range(20):
+            limiter.relax("example.com")
+        assert limiter.host_interval("example.com") == 1.0
+    
+    def test_parse_retry_after(self):
+        """Test parsing Retry-After as seconds, HTTP date, or missing"""
+        assert parse_retry_after({"Retry-After": "7"}) == 7.0
+        assert parse_retry_after({}) is None
+        assert parse_retry_after({"Retry-After": "soon"}) is None
+        
+        wait = parse_retry_after({"Retry-After": formatdate(time.time() + 60, usegmt=True)})
+        assert 55 <= wait <= 60
\ No newline at end of file
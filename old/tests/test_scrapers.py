@@ -0,0 +1,319 @@
+"""
+Tests for scraper behaviour that needs no network access
+"""
+
+import asyncio
+import io
+import json
+import threading
+import time
+from datetime import datetime
+import pytest
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+from bangla_news_scraper.config import Config
+from bangla_news_scraper.exceptions import NetworkException
+from bangla_news_scraper.models import Article
+from bangla_news_scraper.scrapers.base import BaseScraper
+from bangla_news_scraper.scrapers.ittefaq import IttefaqScraper, _DATE_RE
+from bangla_news_scraper.scrapers.prothom_alo import ProthomAloScraper, _json_ld_nodes
+from .conftest import SAMPLE_ARTICLE_DATA
+
+# Ittefaq article whose byline and date sit outside the content divs
+ITTEFAQ_HTML = """
+<html>
+<head><title>একটি দীর্ঘ শিরোনাম যা দশ অক্ষরের বেশি - The Daily Ittefaq</title></head>
+<body>
+<header><nav><a href="/">ইত্তেফাক ডিজিটাল ডেস্ক</a> প্রকাশ : ১৩ সেপ্টেম্বর ২০২৫, ২৩:১১</nav></header>
+<h1>একটি দীর্ঘ শিরোনাম যা দশ অক্ষরের বেশি</h1>
+<div class="content">
+    <p>প্রথম অনুচ্ছেদে যথেষ্ট লেখা আছে যাতে এটি বিষয়বস্তু হিসেবে গণ্য হয় এবং বাছাই পার হয়।</p>
+    <p>দ্বিতীয় অনুচ্ছেদেও যথেষ্ট লেখা আছে যাতে মোট বিষয়বস্তু একশো অক্ষরের বেশি হয়।</p>
+</div>
+</body>
+</html>
+"""
+
+
+class TestScrapeArticles:
+    """Test BaseScraper.scrape_articles scheduling"""
+    
+    def test_stops_fetching_once_limit_is_reached(self):
+        """Test that no more articles are fetched than the limit needs when all are valid"""
+        scraper = IttefaqScraper()
+        fetched = []
+        lock = threading.Lock()
+        
+        def fake_links():
+            for i in range(30):
+                yield f"https://www.ittefaq.com.bd/{i}/news"
+        
+        def fake_scrape(url):
+            time.sleep(0.01)
+            with lock:
+                fetched.append(url)
+            return Article(**dict(SAMPLE_ARTICLE_DATA, url=url))
+        
+        scraper.iter_article_links = fake_links
+        scraper.scrape_article = fake_scrape
+        
+        articles = scraper.scrape_articles(limit=3)
+        assert len(articles) == 3
+        assert len(fetched) == 3
+        assert [a.url for a in articles] == sorted(fetched, key=lambda u: int(u.split('/')[3]))
+    
+    def test_refills_after_invalid_articles(self):
+        """Test that invalid articles are replaced by further candidates, in link order"""
+        scraper = IttefaqScraper()
+        
+        def fake_links():
+            for i in range(9):
+                yield f"https://www.ittefaq.com.bd/{i}/news"
+        
+        def fake_scrape(url):
+            # Every other article fails validation
+            if int(url.split('/')[3]) % 2:
+                return None
+            return Article(**dict(SAMPLE_ARTICLE_DATA, url=url))
+        
+        scraper.iter_article_links = fake_links
+        scraper.scrape_article = fake_scrape
+        
+        articles = scraper.scrape_articles(limit=3)
+        assert [a.url for a in articles] == [
+            "https://www.ittefaq.com.bd/0/news",
+            "https://www.ittefaq.com.bd/2/news",
+            "https://www.ittefaq.com.bd/4/news",
+        ]
+
+
+class TestScrapeArticlesAsync:
+    """Test BaseScraper.scrape_articles_async scheduling"""
+    
+    def test_keeps_first_valid_articles_in_link_order(self):
+        """Test that a slow early article is waited for instead of being replaced by a later one"""
+        pytest.importorskip('aiohttp')
+        scraper = IttefaqScraper()
+        links = [f"https://www.ittefaq.com.bd/{i}/news" for i in range(9)]
+        
+        async def fake_fetch(session, url):
+            # The third article arrives well after the ones behind it
+            await asyncio.sleep(0.2 if url == links[2] else 0.01)
+            return url.encode('utf-8')
+        
+        scraper.get_article_links = lambda limit: links[:limit] if limit else links
+        scraper._fetch_async = fake_fetch
+        scraper.parse_article = lambda content, url: Article(**dict(SAMPLE_ARTICLE_DATA, url=url))
+        
+        articles = asyncio.run(scraper.scrape_articles_async(limit=3, concurrency=9))
+        assert [a.url for a in articles] == links[:3]
+    
+    def test_stop_wakes_waiting_fetches(self):
+        """Test that stop() ends a run whose fetches are all waiting on the rate limiter"""
+        pytest.importorskip('aiohttp')
+        scraper = IttefaqScraper()
+        links = [f"https://www.ittefaq.com.bd/{i}/news" for i in range(5)]
+        scraper.get_article_links = lambda limit: links
+        # Hold every request back long enough that only stop() can end the run
+        scraper.rate_limiter.defer("www.ittefaq.com.bd", 30)
+        
+        start = time.monotonic()
+        threading.Timer(0.1, scraper.stop).start()
+        articles = asyncio.run(scraper.scrape_articles_async(limit=3))
+        assert articles == []
+        assert time.monotonic() - start < 5
+
+
+class TestIttefaqParsing:
+    """Test Ittefaq article extraction"""
+    
+    def test_byline_and_date_match_a_full_parse(self):
+        """Test that author and date match what the whole page text gives"""
+        scraper = IttefaqScraper()
+        url = "https://www.ittefaq.com.bd/751813/some-news"
+        article = scraper.parse_article(ITTEFAQ_HTML.encode('utf-8'), url)
+        
+        full = BeautifulSoup(ITTEFAQ_HTML, 'lxml')
+        assert article is not None
+        assert article.author == scraper._extract_author(full) == 'ইত্তেফাক ডিজিটাল ডেস্ক'
+        assert article.date == scraper._extract_date(full) == '2025-09-13T23:11:00+06:00'
+    
+    def test_comment_only_paragraph_is_not_content(self):
+        """Test that a paragraph holding only an HTML comment adds nothing to the content"""
+        scraper = IttefaqScraper()
+        html = ITTEFAQ_HTML.replace(
+            '<div class="content">',
+            '<div class="content"><p><!-- googletag.cmd.push(function() { googletag.display("ad"); }); --></p>'
+        )
+        content = scraper._extract_content(BeautifulSoup(html, 'lxml'))
+        assert 'googletag' not in content
+        assert content.startswith('প্রথম অনুচ্ছেদে')
+    
+    def _date_from(self, text):
+        """Date IttefaqScraper extracts from a page whose only text is the given line"""
+        scraper = IttefaqScraper()
+        return scraper._extract_date(BeautifulSoup(f'<html><body><p>{text}</p></body></html>', 'lxml'))
+    
+    def test_date_with_bengali_digits(self):
+        """Test that a Bengali-numeral publish date and time convert to ISO"""
+        assert self._date_from('প্রকাশ : ১৩ সেপ্টেম্বর ২০২৫, ২৩:১১') == '2025-09-13T23:11:00+06:00'
+    
+    def test_date_with_ascii_digits(self):
+        """Test that ASCII numerals are accepted and short fields are zero-padded"""
+        assert self._date_from('প্রকাশ : 5 মার্চ 2024, 9:05') == '2024-03-05T09:05:00+06:00'
+        assert self._date_from('প্রকাশ: ১ মে ২০২৪') == '2024-05-01T00:00:00+06:00'
+    
+    def test_date_every_month(self):
+        """Test that each Bengali month name maps to its month number"""
+        months = [
+            'জানুয়ারি', 'ফেব্রুয়ারি', 'মার্চ', 'এপ্রিল', 'মে', 'জুন',
+            'জুলাই', 'আগস্ট', 'সেপ্টেম্বর', 'অক্টোবর', 'নভেম্বর', 'ডিসেম্বর'
+        ]
+        for number, month in enumerate(months, 1):
+            assert self._date_from(f'প্রকাশ : ১০ {month} ২০২৫, ১০:৩০') == f'2025-{number:02d}-10T10:30:00+06:00'
+    
+    def test_date_not_matching(self):
+        """Test that text without a Bengali publish date falls back to the current time"""
+        assert _DATE_RE.search('প্রকাশ : 13 September 2025, 23:11') is None
+        date = self._date_from('প্রকাশ : 13 September 2025, 23:11')
+        assert not date.endswith('+06:00')
+        assert date.startswith(str(datetime.now().year))
+
+
+class FakeResponse:
+    """Just enough of a response for link collection"""
+    
+    def __init__(self, content: bytes):
+        self.content = content
+
+
+class TestProthomAloParsing:
+    """Test Prothom Alo link collection and article extraction"""
+    
+    def test_sections_are_fetched_lazily(self):
+        """Test that only a bounded window of sections is fetched and none outlive the consumer"""
+        scraper = ProthomAloScraper()
+        requested = []
+        lock = threading.Lock()
+        
+        def fake_request(url):
+            with lock:
+                requested.append(url)
+            slug = url.rstrip('/').rsplit('/', 1)[-1] or 'home'
+            links = ''.join(
+                f'<a href="/{slug}/article-number-{i}-with-a-long-slug">x</a>' for i in range(5)
+            )
+            return FakeResponse(f'<html><body>{links}</body></html>'.encode('utf-8'))
+        
+        scraper._make_request = fake_request
+        links = scraper.iter_article_links()
+        # The homepage's five links, then two from the first section
+        taken = [next(links) for _ in range(7)]
+        links.close()
+        
+        sections = Config.get_site_config('prothom-alo')['sections']
+        assert len(set(taken)) == 7
+        assert len(requested) == 1 + 1 + Config.SECTION_FETCH_WORKERS
+        assert len(requested) < 1 + len(sections)
+        
+        # Closing waited for the lookahead, so nothing is fetched afterwards
+        time.sleep(0.05)
+        assert len(requested) == 1 + 1 + Config.SECTION_FETCH_WORKERS
+    
+    def test_comment_only_paragraph_is_not_content(self):
+        """Test that the paragraph fallback skips a paragraph holding only an HTML comment"""
+        scraper = ProthomAloScraper()
+        html = (
+            '<html><body>'
+            '<p><!-- googletag.cmd.push(function() { googletag.display("ad"); }); --></p>'
+            '<p>প্রথম আলোর এই অনুচ্ছেদে যথেষ্ট লেখা আছে।</p>'
+            '</body></html>'
+        )
+        content = scraper._extract_content(BeautifulSoup(html, 'lxml'))
+        assert content == 'প্রথম আলোর এই অনুচ্ছেদে যথেষ্ট লেখা আছে।'
+    
+    def test_json_ld_graph_image(self):
+        """Test that the image comes from the Article node of a JSON-LD @graph"""
+        scraper = ProthomAloScraper()
+        data = {
+            '@context': 'https://schema.org',
+            '@graph': [
+                {'@type': 'Organization', 'logo': {'url': 'https://images.prothomalo.com/logo.png'}},
+                {'@type': 'WebPage', 'image': 'https://images.prothomalo.com/page.jpg'},
+                {'@type': ['NewsArticle'], 'image': [{'url': 'https://images.prothomalo.com/lead.jpg'}]},
+                'not a node',
+            ]
+        }
+        nodes = list(_json_ld_nodes(data))
+        assert [node.get('@type') for node in nodes] == [None, ['NewsArticle']]
+        
+        html = (
+            '<html><head><script type="application/ld+json">'
+            + json.dumps(data)
+            + '</script></head><body></body></html>'
+        )
+        image = scraper._extract_main_image(BeautifulSoup(html, 'lxml'), "https://www.prothomalo.com/bangladesh/x")
+        assert image == 'https://images.prothomalo.com/lead.jpg'
+
+
+class TrackedBody(io.BytesIO):
+    """Response body that remembers how far it was read before being closed"""
+    
+    read_upto = 0
+    
+    def close(self):
+        if not self.closed:
+            self.read_upto = self.tell()
+        super().close()
+
+
+class FakeAdapter(HTTPAdapter):
+    """Serves fixed pages without the network, remembering how much of each body was read"""
+    
+    def __init__(self, pages):
+        super().__init__()
+        self.pages = pages
+        self.bodies = {}
+    
+    def send(self, request, **kwargs):
+        body, headers = self.pages[request.url]
+        stream = self.bodies[request.url] = TrackedBody(body)
+        raw = HTTPResponse(body=stream, headers=headers, status=200, preload_content=False)
+        return self.build_response(request, raw)
+
+
+class TestHttpCacheSizeCap:
+    """Test the response size cap with the requests-cache session"""
+    
+    def test_oversized_responses_are_not_cached(self, temp_dir, monkeypatch):
+        """Test that pages over the cap are refused and kept out of the HTTP cache"""
+        pytest.importorskip('requests_cache')
+        monkeypatch.setattr(Config, 'CACHE_ENABLED', True)
+        monkeypatch.setattr(Config, 'HTTP_CACHE_NAME', f"{temp_dir}/http_cache")
+        monkeypatch.setattr(Config, 'MAX_RESPONSE_BYTES', 1000)
+        
+        base = "https://www.ittefaq.com.bd"
+        html = {'Content-Type': 'text/html; charset=utf-8'}
+        adapter = FakeAdapter({
+            f"{base}/1/small": (b'x' * 500, dict(html, **{'Content-Length': '500'})),
+            f"{base}/2/announced": (b'x' * 5000, dict(html, **{'Content-Length': '5000'})),
+            f"{base}/3/chunked": (b'x' * 5000, html),
+        })
+        session = BaseScraper.create_session()
+        session.mount('https://', adapter)
+        scraper = IttefaqScraper(session=session)
+        
+        assert scraper._make_request(f"{base}/1/small").content == b'x' * 500
+        assert session.cache.contains(url=f"{base}/1/small")
+        
+        # An announced oversized body is refused from the headers, without reading it
+        with pytest.raises(NetworkException):
+            scraper._make_request(f"{base}/2/announced")
+        assert adapter.bodies[f"{base}/2/announced"].read_upto == 0
+        assert not session.cache.contains(url=f"{base}/2/announced")
+        
+        # Without Content-Length the cache reads the body first; the entry is dropped again
+        with pytest.raises(NetworkException):
+            scraper._make_request(f"{base}/3/chunked")
+        assert not session.cache.contains(url=f"{base}/3/chunked")
\ No newline at end of file